@@ -1,9 +1,20 @@
 from __future__ import annotations
-from typing import Any, Optional, List, Dict, Tuple
-from enum import Enum
-import random
+from typing import Any, Optional, List, Dict, Mapping, Tuple
+from types import MappingProxyType
+from collections import deque
+from functools import lru_cache
 
-class OperationType(Enum):
+@lru_cache(maxsize=None)
+def _bfs_kernel():
+    """JIT-compiled CSR BFS kernel, or None when numba is not installed"""
+    try:
+        from .graph_kernels import bfs_csr
+    except ImportError:
+        return None
+    return bfs_csr
+
+class OperationType:
+    """Operation names, kept as plain strings so lookups skip Enum machinery"""
     PUSH = "push"
     POP = "pop"
     ENQUEUE = "enqueue"
@@ -14,62 +25,97 @@ class OperationType(Enum):
     TRAVERSE = "traverse"
 
 class DataStructure:
+    __slots__ = ('name', 'elements', 'operations', '_version')
+    
     def __init__(self, name: str):
         self.name = name
         self.elements: List[Any] = []
-        self.operations: List[Tuple[OperationType, Any]] = []
+        self.operations: List[Tuple[str, Any]] = []
+        self._version = 0  # Bumped on every mutation
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the structure is modified"""
+        return self._version
+    
+    def get_state(self) -> Mapping[str, Any]:
+        """Read-only view over the live state; callers must not mutate it"""
+        return MappingProxyType({
+            'elements': self.elements,
+            'operations': self.operations,
+            'version': self._version
+        })
     
-    def get_state(self) -> Dict:
+    def snapshot(self) -> Dict:
+        """Independent copy of the current state"""
         return {
-            'elements': self.elements.copy(),
-            'operations': self.operations.copy()
+            'elements': list(self.elements),
+            'operations': self.operations.copy(),
+            'version': self._version
         }
     
     def reset(self):
         self.elements.clear()
         self.operations.clear()
+        self._version += 1
+    
+    def _record_op(self, operation: str, argument: Any):
+        """Log an operation and mark the state as changed"""
+        # list.append already over-allocates geometrically, so the log grows
+        # with amortised O(1) appends and no manual capacity management.
+        self.operations.append((operation, argument))
+        self._version += 1
 
 class Stack(DataStructure):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Stack")
     
     def push(self, item: Any) -> bool:
         self.elements.append(item)
-        self.operations.append((OperationType.PUSH, item))
+        self._record_op(OperationType.PUSH, item)
         return True
     
     def pop(self) -> Any:
         if not self.elements:
             return None
         item = self.elements.pop()
-        self.operations.append((OperationType.POP, item))
+        self._record_op(OperationType.POP, item)
         return item
     
     def peek(self) -> Any:
         return self.elements[-1] if self.elements else None
 
 class Queue(DataStructure):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Queue")
+        self.elements: deque = deque()  # O(1) removal from the front
     
     def enqueue(self, item: Any) -> bool:
         self.elements.append(item)
-        self.operations.append((OperationType.ENQUEUE, item))
+        self._record_op(OperationType.ENQUEUE, item)
         return True
     
     def dequeue(self) -> Any:
         if not self.elements:
             return None
-        item = self.elements.pop(0)
-        self.operations.append((OperationType.DEQUEUE, item))
+        item = self.elements.popleft()
+        self._record_op(OperationType.DEQUEUE, item)
         return item
 
 class LinkedListNode:
+    __slots__ = ('value', 'next')
+    
     def __init__(self, value: Any):
         self.value = value
         self.next: Optional[LinkedListNode] = None
 
 class LinkedList(DataStructure):
+    __slots__ = ('head',)
+    
     def __init__(self):
         super().__init__("Linked List")
         self.head: Optional[LinkedListNode] = None
@@ -81,17 +127,20 @@ class LinkedList(DataStructure):
         if position == 0 or not self.head:
             new_node.next = self.head
             self.head = new_node
+            index = 0
         else:
             current = self.head
+            index = 1
             for _ in range(position - 1):
                 if not current.next:
                     break
                 current = current.next
+                index += 1
             new_node.next = current.next
             current.next = new_node
         
-        self._update_elements()
-        self.operations.append((OperationType.INSERT, (value, position)))
+        self.elements.insert(index, value)
+        self._record_op(OperationType.INSERT, (value, position))
         return True
     
     def delete(self, value: Any) -> bool:
@@ -100,21 +149,27 @@ class LinkedList(DataStructure):
             
         if self.head.value == value:
             self.head = self.head.next
-            self._update_elements()
-            self.operations.append((OperationType.DELETE, value))
+            del self.elements[0]
+            self._record_op(OperationType.DELETE, value)
             return True
             
         current = self.head
+        index = 1
         while current.next:
             if current.next.value == value:
                 current.next = current.next.next
-                self._update_elements()
-                self.operations.append((OperationType.DELETE, value))
+                del self.elements[index]
+                self._record_op(OperationType.DELETE, value)
                 return True
             current = current.next
+            index += 1
             
         return False
     
+    def reset(self):
+        super().reset()
+        self.head = None
+    
     def _update_elements(self):
         self.elements = []
         current = self.head
@@ -123,12 +178,16 @@ class LinkedList(DataStructure):
             current = current.next
 
 class BinaryTreeNode:
+    __slots__ = ('value', 'left', 'right')
+    
     def __init__(self, value: Any):
         self.value = value
         self.left: Optional[BinaryTreeNode] = None
         self.right: Optional[BinaryTreeNode] = None
 
 class BinaryTree(DataStructure):
+    __slots__ = ('root',)
+    
     def __init__(self):
         super().__init__("Binary Tree")
         self.root: Optional[BinaryTreeNode] = None
@@ -136,40 +195,55 @@ class BinaryTree(DataStructure):
     def insert(self, value: Any) -> bool:
         if not self.root:
             self.root = BinaryTreeNode(value)
-            self._update_elements()
-            self.operations.append((OperationType.INSERT, value))
+            self._append_element(value)
+            self._record_op(OperationType.INSERT, value)
             return True
             
-        queue = [self.root]
+        queue = deque([self.root])
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             
             if not node.left:
                 node.left = BinaryTreeNode(value)
-                self._update_elements()
-                self.operations.append((OperationType.INSERT, value))
+                self._append_element(value)
+                self._record_op(OperationType.INSERT, value)
                 return True
             else:
                 queue.append(node.left)
                 
             if not node.right:
                 node.right = BinaryTreeNode(value)
-                self._update_elements()
-                self.operations.append((OperationType.INSERT, value))
+                self._append_element(value)
+                self._record_op(OperationType.INSERT, value)
                 return True
             else:
                 queue.append(node.right)
         
         return False
     
+    def reset(self):
+        super().reset()
+        self.root = None
+    
+    def _append_element(self, value: Any):
+        """Record an inserted value without re-walking the tree"""
+        # Level-order values come first, followed by n + 1 empty-child
+        # markers; the new node always takes the first marker's slot.
+        if not self.elements:
+            self.elements = [value, None, None]
+            return
+        self.elements[(len(self.elements) - 1) // 2] = value
+        self.elements.append(None)
+        self.elements.append(None)
+    
     def _update_elements(self):
         self.elements = []
         if not self.root:
             return
             
-        queue = [self.root]
+        queue = deque([self.root])
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             if node:
                 self.elements.append(node.value)
                 queue.append(node.left)
@@ -178,41 +252,99 @@ class BinaryTree(DataStructure):
                 self.elements.append(None)
 
 class Graph(DataStructure):
+    __slots__ = ('adjacency_list', '_csr', '_elements', '_elements_dirty')
+    
     def __init__(self):
         super().__init__("Graph")
-        self.adjacency_list: Dict[Any, List[Any]] = {}
+        # Neighbours are kept as insertion-ordered dict keys: O(1) membership
+        # like a set, but traversal order stays deterministic.
+        self.adjacency_list: Dict[Any, Dict[Any, None]] = {}
+        self._csr: Optional[Tuple] = None  # Built on demand by to_csr()
+        self._elements_dirty = False
+    
+    @property
+    def elements(self) -> List[Any]:
+        # Rebuilt lazily so growing a graph does not repack it on every edge
+        if self._elements_dirty:
+            self._update_elements()
+        return self._elements
+    
+    @elements.setter
+    def elements(self, value: List[Any]):
+        self._elements = value
+    
+    def reset(self):
+        super().reset()
+        self.adjacency_list.clear()
+        self._csr = None
+        self._elements_dirty = True
     
     def add_vertex(self, vertex: Any) -> bool:
         if vertex not in self.adjacency_list:
-            self.adjacency_list[vertex] = []
-            self._update_elements()
+            self.adjacency_list[vertex] = {}
+            self._csr = None
+            self._elements_dirty = True
+            self._version += 1
             return True
         return False
     
     def add_edge(self, vertex1: Any, vertex2: Any) -> bool:
         if vertex1 in self.adjacency_list and vertex2 in self.adjacency_list:
             if vertex2 not in self.adjacency_list[vertex1]:
-                self.adjacency_list[vertex1].append(vertex2)
-                self.adjacency_list[vertex2].append(vertex1)  # For undirected graph
-                self._update_elements()
-                self.operations.append((OperationType.INSERT, (vertex1, vertex2)))
+                self.adjacency_list[vertex1][vertex2] = None
+                self.adjacency_list[vertex2][vertex1] = None  # For undirected graph
+                self._csr = None
+                self._elements_dirty = True
+                self._record_op(OperationType.INSERT, (vertex1, vertex2))
                 return True
         return False
     
     def _update_elements(self):
-        self.elements = []
-        for vertex, neighbors in self.adjacency_list.items():
-            self.elements.append((vertex, neighbors))
+        self._elements = [
+            (vertex, list(neighbors))
+            for vertex, neighbors in self.adjacency_list.items()
+        ]
+        self._elements_dirty = False
     
     def bfs(self, start_vertex: Any) -> List[Any]:
-        visited = []
-        queue = [start_vertex]
+        # Vertices are marked when first queued, so each enters the queue once
+        visited = {start_vertex}
+        order = []
+        queue = deque([start_vertex])
         
         while queue:
-            vertex = queue.pop(0)
-            if vertex not in visited:
-                visited.append(vertex)
-                queue.extend([v for v in self.adjacency_list[vertex] if v not in visited])
+            vertex = queue.popleft()
+            order.append(vertex)
+            for v in self.adjacency_list[vertex]:
+                if v not in visited:
+                    visited.add(v)
+                    queue.append(v)
+        
+        self._record_op(OperationType.TRAVERSE, ("BFS", start_vertex))
+        return order
+    
+    def to_csr(self) -> Tuple[Any, Any, List[Any]]:
+        """Adjacency as CSR arrays (indptr, indices) plus the vertex for each index"""
+        if self._csr is None:
+            import numpy as np
+            vertices = list(self.adjacency_list)
+            index = {vertex: i for i, vertex in enumerate(vertices)}
+            indptr = np.zeros(len(vertices) + 1, dtype=np.int32)
+            indices: List[int] = []
+            for i, vertex in enumerate(vertices):
+                indices.extend(index[v] for v in self.adjacency_list[vertex])
+                indptr[i + 1] = len(indices)
+            self._csr = (indptr, np.array(indices, dtype=np.int32), vertices, index)
+        return self._csr[:3]
+    
+    def bfs_fast(self, start_vertex: Any) -> List[Any]:
+        """Same result as bfs(), using the compiled CSR kernel when numba is available"""
+        kernel = _bfs_kernel()
+        if kernel is None or start_vertex not in self.adjacency_list:
+            return self.bfs(start_vertex)
+        
+        indptr, indices, vertices = self.to_csr()
+        order = kernel(indptr, indices, self._csr[3][start_vertex])
         
-        self.operations.append((OperationType.TRAVERSE, ("BFS", start_vertex)))
-        return visited
+        self._record_op(OperationType.TRAVERSE, ("BFS", start_vertex))
+        return [vertices[i] for i in order]
@@ -0,0 +1,30 @@
+"""Numba-compiled graph kernels.
+
+Importing this module requires numba; callers fall back to the pure
+Python implementations when it is not installed.
+"""
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def bfs_csr(indptr, indices, start):
+    """Breadth-first visit order over a CSR adjacency structure"""
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, np.uint8)
+    # Each vertex is enqueued at most once, so the queue doubles as the
+    # visit order and never needs more than n slots.
+    queue = np.empty(n, np.int32)
+    head = 0
+    tail = 1
+    queue[0] = start
+    visited[start] = 1
+    while head < tail:
+        vertex = queue[head]
+        head += 1
+        for k in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue[tail] = neighbor
+                tail += 1
+    return queue[:tail]
@@ -1,12 +1,37 @@
 import os
-import yaml
+import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Type, Any
 from pathlib import Path
 from enum import Enum
-import random
 from .puzzle import Puzzle, PuzzleType, PuzzleDifficulty
 from .data_structures import Stack, Queue, LinkedList, BinaryTree, Graph
 
+# Project directory holding the default levels folder and the save file
+GAME_ROOT = Path(__file__).resolve().parents[2]
+
+# Parsed level data is cached here, inside the levels directory
+LEVEL_CACHE_FILE = '.levels.cache.json'
+
+# Map string data structure names to actual classes
+_DS_MAP = {
+    'Stack': Stack,
+    'Queue': Queue,
+    'LinkedList': LinkedList,
+    'BinaryTree': BinaryTree,
+    'Graph': Graph
+}
+
+@lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use, preferring the libyaml C loader/dumper"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
 class LevelCategory(Enum):
     TUTORIAL = "tutorial"
     PRACTICE = "practice"
@@ -65,22 +90,13 @@ class Level:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Level':
         """Create a Level instance from a dictionary"""
-        # Map string data structure names to actual classes
-        ds_map = {
-            'Stack': Stack,
-            'Queue': Queue,
-            'LinkedList': LinkedList,
-            'BinaryTree': BinaryTree,
-            'Graph': Graph
-        }
-        
         return cls(
             level_id=data['level_id'],
             title=data['title'],
             description=data['description'],
             category=LevelCategory(data['category']),
             difficulty=PuzzleDifficulty(data['difficulty']),
-            data_structure_type=ds_map[data['data_structure']],
+            data_structure_type=_DS_MAP[data['data_structure']],
             required_score=data.get('required_score', 0),
             unlocks=data.get('unlocks', [])
         )
@@ -89,10 +105,9 @@ class LevelManager:
     def __init__(self, levels_dir: str = None):
         self.levels: Dict[int, Level] = {}
         self.current_level_id: Optional[int] = None
-        self.levels_dir = levels_dir or os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'levels'
-        )
+        self.levels_dir = levels_dir or str(GAME_ROOT / 'levels')
+        self._save_path = GAME_ROOT / 'save_game.json'
+        self._legacy_save_path = GAME_ROOT / 'save_game.yaml'  # pre-JSON saves
         self._load_levels()
     
     def _load_levels(self):
@@ -101,21 +116,55 @@ class LevelManager:
         levels_path.mkdir(exist_ok=True, parents=True)
         
         # Load default levels if no custom levels exist
-        if not any(levels_path.iterdir()):
+        if not any(p.name != LEVEL_CACHE_FILE for p in levels_path.iterdir()):
             self._create_default_levels()
             return
-            
-        for level_file in levels_path.glob('*.yaml'):
+        
+        level_files = sorted(levels_path.glob('*.yaml'))
+        cache_path = levels_path / LEVEL_CACHE_FILE
+        cache_key = [[f.name, f.stat().st_mtime_ns] for f in level_files]
+        
+        # Reuse the parsed data from the last run if no YAML file changed
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('key') == cache_key:
+                for data in cache['levels']:
+                    self._add_level(data)
+                return
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error reading level cache {cache_path}: {e}")
+        
+        yaml, SafeLoader, _ = _yaml()
+        parsed: List[Dict[str, Any]] = []
+        complete = True
+        for level_file in level_files:
             try:
                 with open(level_file, 'r') as f:
-                    level_data = yaml.safe_load(f)
+                    level_data = yaml.load(f, Loader=SafeLoader)
                     if isinstance(level_data, list):
-                        for data in level_data:
-                            self._add_level(data)
+                        parsed.extend(level_data)
                     else:
-                        self._add_level(level_data)
+                        parsed.append(level_data)
             except Exception as e:
+                complete = False
                 print(f"Error loading level from {level_file}: {e}")
+        
+        for data in parsed:
+            self._add_level(data)
+        
+        # Only cache a clean parse so broken files keep reporting their errors,
+        # and only data that comes back from JSON unchanged
+        if complete:
+            try:
+                text = json.dumps({'key': cache_key, 'levels': parsed})
+                if json.loads(text)['levels'] == parsed:
+                    with open(cache_path, 'w') as f:
+                        f.write(text)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error writing level cache {cache_path}: {e}")
     
     def _add_level(self, level_data: Dict[str, Any]):
         """Add a level from dictionary data"""
@@ -211,6 +260,7 @@ class LevelManager:
         ]
         
         # Save default levels to files
+        yaml, _, SafeDumper = _yaml()
         for level_data in default_levels:
             self._add_level(level_data)
             
@@ -220,7 +270,7 @@ class LevelManager:
                 f"level_{level_data['level_id']}.yaml"
             )
             with open(level_file, 'w') as f:
-                yaml.dump(level_data, f)
+                yaml.dump(level_data, f, Dumper=SafeDumper)
     
     def get_level(self, level_id: int) -> Optional[Level]:
         """Get a level by ID"""
@@ -231,7 +281,7 @@ class LevelManager:
         return [
             level for level in self.levels.values() 
             if level.completed or level.required_score == 0 or 
-               any(self.levels.get(uid, Level(0, '', '', LevelCategory.PRACTICE, 1, Stack, 0)).completed 
+               any(uid in self.levels and self.levels[uid].completed
                    for uid in level.unlocks)
         ]
     
@@ -263,43 +313,45 @@ class LevelManager:
             }
         }
         
-        save_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'save_game.yaml'
-        )
-        
         try:
-            with open(save_path, 'w') as f:
-                yaml.dump(save_data, f)
+            with open(self._save_path, 'w') as f:
+                json.dump(save_data, f)
         except Exception as e:
             print(f"Error saving game: {e}")
     
     def load_progress(self):
         """Load progress from a save file"""
-        save_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'save_game.yaml'
-        )
-        
-        if not os.path.exists(save_path):
+        # Progress saved before the switch to JSON is read once and migrated
+        migrate = not self._save_path.exists()
+        if migrate and not self._legacy_save_path.exists():
             return
             
         try:
-            with open(save_path, 'r') as f:
-                save_data = yaml.safe_load(f)
+            if migrate:
+                yaml, SafeLoader, _ = _yaml()
+                with open(self._legacy_save_path, 'r') as f:
+                    save_data = yaml.load(f, Loader=SafeLoader)
+            else:
+                with open(self._save_path, 'r') as f:
+                    save_data = json.load(f)
                 
-                if not save_data:
-                    return
-                    
-                self.current_level_id = save_data.get('current_level_id')
+            if not save_data:
+                return
                 
-                levels_data = save_data.get('levels', {})
-                for level_id, level_data in levels_data.items():
-                    if level_id in self.levels:
-                        level = self.levels[level_id]
-                        level.completed = level_data.get('completed', False)
-                        level.high_score = level_data.get('high_score', 0)
-                        level.attempts = level_data.get('attempts', 0)
+            self.current_level_id = save_data.get('current_level_id')
+            
+            levels_data = save_data.get('levels', {})
+            for level_id, level_data in levels_data.items():
+                # JSON object keys are always strings
+                level_id = int(level_id)
+                if level_id in self.levels:
+                    level = self.levels[level_id]
+                    level.completed = level_data.get('completed', False)
+                    level.high_score = level_data.get('high_score', 0)
+                    level.attempts = level_data.get('attempts', 0)
+            
+            if migrate:
+                self.save_progress()
                         
         except Exception as e:
             print(f"Error loading saved game: {e}")
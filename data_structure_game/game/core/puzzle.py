@@ -1,6 +1,7 @@
-from typing import List, Dict, Any, Optional, Type, Union
+from typing import List, Dict, Any, Callable, Optional, Tuple, Type, Union
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
+from enum import Enum, IntEnum
 import random
 from .data_structures import DataStructure, Stack, Queue, LinkedList, BinaryTree, Graph, OperationType
 
@@ -10,16 +11,26 @@ class PuzzleType(Enum):
     VALIDATION = "validation"
     OPTIMIZATION = "optimization"
 
-class PuzzleDifficulty(Enum):
+class PuzzleDifficulty(IntEnum):
     EASY = 1
     MEDIUM = 2
     HARD = 3
     EXPERT = 4
 
-@dataclass
+@lru_cache(maxsize=None)
+def _ds_factory(ds_type: Any) -> Optional[Callable[[], DataStructure]]:
+    """Zero-argument constructor for a data structure type, or None"""
+    # Every concrete data structure takes no constructor arguments, so the
+    # class itself is the factory; the check only runs once per type.
+    if (isinstance(ds_type, type) and issubclass(ds_type, DataStructure)
+            and ds_type is not DataStructure):
+        return ds_type
+    return None
+
+@dataclass(frozen=True)
 class PuzzleStep:
-    operation: OperationType
-    parameters: list
+    operation: str  # one of the OperationType constants
+    parameters: Tuple[Any, ...]  # immutable: step templates are shared between puzzles
     expected_result: Any
     hint: str = ""
 
@@ -41,16 +52,9 @@ class Puzzle:
     
     def initialize_structure(self):
         """Initialize the appropriate data structure based on type"""
-        if self.data_structure_type == Stack:
-            self.data_structure = Stack()
-        elif self.data_structure_type == Queue:
-            self.data_structure = Queue()
-        elif self.data_structure_type == LinkedList:
-            self.data_structure = LinkedList()
-        elif self.data_structure_type == BinaryTree:
-            self.data_structure = BinaryTree()
-        elif self.data_structure_type == Graph:
-            self.data_structure = Graph()
+        factory = _ds_factory(self.data_structure_type)
+        if factory:
+            self.data_structure = factory()
     
     def add_step(self, step: PuzzleStep):
         """Add a step to the puzzle"""
@@ -69,7 +73,7 @@ class Puzzle:
             return False
             
         # Get the operation and execute it on the data structure
-        operation = getattr(self.data_structure, current_step.operation.value, None)
+        operation = getattr(self.data_structure, current_step.operation, None)
         if not operation:
             return False
             
@@ -100,6 +104,54 @@ class Puzzle:
         self.solved = False
         self.initialize_structure()
 
+# Step templates per data structure and difficulty. Steps are immutable, so
+# every generated puzzle can share the same instances.
+_STACK_STEPS: Dict[PuzzleDifficulty, Tuple[PuzzleStep, ...]] = {
+    PuzzleDifficulty.EASY: (
+        PuzzleStep(
+            operation=OperationType.PUSH,
+            parameters=(5,),
+            expected_result=True,
+            hint="Use the push operation to add an element to the stack."
+        ),
+        PuzzleStep(
+            operation=OperationType.PUSH,
+            parameters=(10,),
+            expected_result=True,
+            hint="Add another element to the stack."
+        ),
+        PuzzleStep(
+            operation=OperationType.POP,
+            parameters=(),
+            expected_result=10,
+            hint="Remove the top element from the stack."
+        ),
+    ),
+}
+
+_QUEUE_STEPS: Dict[PuzzleDifficulty, Tuple[PuzzleStep, ...]] = {
+    PuzzleDifficulty.EASY: (
+        PuzzleStep(
+            operation=OperationType.ENQUEUE,
+            parameters=("A",),
+            expected_result=True,
+            hint="Use enqueue to add an element to the queue."
+        ),
+        PuzzleStep(
+            operation=OperationType.ENQUEUE,
+            parameters=("B",),
+            expected_result=True,
+            hint="Add another element to the queue."
+        ),
+        PuzzleStep(
+            operation=OperationType.DEQUEUE,
+            parameters=(),
+            expected_result="A",
+            hint="Remove the first element from the queue (FIFO)."
+        ),
+    ),
+}
+
 class PuzzleSolver:
     """Helper class to generate and solve puzzles"""
     
@@ -116,26 +168,8 @@ class PuzzleSolver:
         )
         
         # Add steps based on difficulty
-        if difficulty == PuzzleDifficulty.EASY:
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.PUSH,
-                parameters=[5],
-                expected_result=True,
-                hint="Use the push operation to add an element to the stack."
-            ))
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.PUSH,
-                parameters=[10],
-                expected_result=True,
-                hint="Add another element to the stack."
-            ))
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.POP,
-                parameters=[],
-                expected_result=10,
-                hint="Remove the top element from the stack."
-            ))
-            
+        puzzle.steps = list(_STACK_STEPS.get(difficulty, ()))
+        
         # Add more difficulty levels...
         
         return puzzle
@@ -152,26 +186,8 @@ class PuzzleSolver:
             data_structure_type=Queue
         )
         
-        if difficulty == PuzzleDifficulty.EASY:
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.ENQUEUE,
-                parameters=["A"],
-                expected_result=True,
-                hint="Use enqueue to add an element to the queue."
-            ))
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.ENQUEUE,
-                parameters=["B"],
-                expected_result=True,
-                hint="Add another element to the queue."
-            ))
-            puzzle.add_step(PuzzleStep(
-                operation=OperationType.DEQUEUE,
-                parameters=[],
-                expected_result="A",
-                hint="Remove the first element from the queue (FIFO)."
-            ))
-            
+        puzzle.steps = list(_QUEUE_STEPS.get(difficulty, ()))
+        
         return puzzle
     
     # Add similar generator methods for other data structures...
@@ -180,10 +196,14 @@ class PuzzleSolver:
     def generate_puzzle(data_structure_type: Type[DataStructure], 
                        difficulty: PuzzleDifficulty = PuzzleDifficulty.EASY) -> Puzzle:
         """Generate a puzzle for the specified data structure"""
-        if data_structure_type == Stack:
-            return PuzzleSolver.generate_stack_puzzle(difficulty)
-        elif data_structure_type == Queue:
-            return PuzzleSolver.generate_queue_puzzle(difficulty)
-        # Add other data structure types...
+        generator = _PUZZLE_GENERATORS.get(data_structure_type)
+        if generator:
+            return generator(difficulty)
         
         raise ValueError(f"Unsupported data structure type: {data_structure_type}")
+
+# Puzzle generators by data structure; add other data structure types here...
+_PUZZLE_GENERATORS = {
+    Stack: PuzzleSolver.generate_stack_puzzle,
+    Queue: PuzzleSolver.generate_queue_puzzle,
+}
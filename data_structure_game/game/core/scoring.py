@@ -1,6 +1,8 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Deque
 import time
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 
 class ScoreModifier(Enum):
@@ -10,18 +12,30 @@ class ScoreModifier(Enum):
     OK = 0.8
     POOR = 0.5
 
-@dataclass
+# Most recent score events kept per session; older ones live on only in the totals
+MAX_SCORE_EVENTS = 1024
+
+# Minimum accuracy for each grade above F; S+ additionally requires a perfect run
+_GRADE_THRESHOLDS = (60.0, 70.0, 80.0, 90.0, 95.0, 99.0)
+_GRADES = ('F', 'D', 'C', 'B', 'A', 'S', 'S+')
+
+@dataclass(frozen=True, slots=True)
 class ScoreEvent:
     points: int
     modifier: ScoreModifier
     timestamp: float
     message: str = ""
+    modified_points: int = field(init=False, repr=False, compare=False)
     
-    @property
-    def modified_points(self) -> int:
-        return int(self.points * self.modifier.value)
+    def __post_init__(self):
+        # Computed once at construction; frozen instances need object.__setattr__
+        object.__setattr__(self, 'modified_points', int(self.points * self.modifier.value))
 
 class ScoreSystem:
+    # Combo multipliers for combos of 5..9 and 10+; shorter combos keep the current one
+    _COMBO_MIN = 5
+    _COMBO_MULTIPLIERS = (1.5, 1.5, 1.5, 1.5, 1.5, 2.0)
+    
     def __init__(self, base_points: int = 100, time_limit: float = 60.0):
         self.base_points = base_points
         self.time_limit = time_limit  # Time in seconds
@@ -30,11 +44,23 @@ class ScoreSystem:
         self.multiplier: float = 1.0
         self.combo: int = 0
         self.max_combo: int = 0
-        self.events: list[ScoreEvent] = []
+        self.events: Deque[ScoreEvent] = deque(maxlen=MAX_SCORE_EVENTS)
         self.bonus_points: int = 0
         self.time_penalty: float = 0.0
         self.completed: bool = False
         self.perfect: bool = True
+        
+        # Running totals for the accuracy calculation in get_results
+        self._sum_possible: float = 0.0
+        self._sum_actual: int = 0
+        self._final_results: Optional[Dict[str, Any]] = None
+        self._grade: Optional[str] = None
+    
+    def _record_event(self, event: ScoreEvent):
+        """Append an event and fold it into the running totals"""
+        self.events.append(event)
+        self._sum_possible += max(0, event.points) * event.modifier.value
+        self._sum_actual += event.modified_points
     
     def start(self):
         """Start the scoring system"""
@@ -53,7 +79,7 @@ class ScoreSystem:
             message=message
         )
         
-        self.events.append(event)
+        self._record_event(event)
         
         # Update combo
         if modifier == ScoreModifier.POOR:
@@ -61,13 +87,12 @@ class ScoreSystem:
             self.perfect = False
         else:
             self.combo += 1
-            self.max_combo = max(self.max_combo, self.combo)
+            if self.combo > self.max_combo:
+                self.max_combo = self.combo
             
             # Increase multiplier based on combo
-            if self.combo >= 10:
-                self.multiplier = 2.0
-            elif self.combo >= 5:
-                self.multiplier = 1.5
+            if self.combo >= self._COMBO_MIN:
+                self.multiplier = self._COMBO_MULTIPLIERS[min(self.combo, 10) - self._COMBO_MIN]
         
         # Calculate modified points with current multiplier
         modified_points = int(event.modified_points * self.multiplier)
@@ -84,7 +109,7 @@ class ScoreSystem:
         """Add bonus points"""
         if not self.completed:
             self.bonus_points += points
-            self.events.append(ScoreEvent(
+            self._record_event(ScoreEvent(
                 points=points,
                 modifier=ScoreModifier.PERFECT,
                 timestamp=time.time() - (self.start_time or 0),
@@ -120,26 +145,30 @@ class ScoreSystem:
         if self.time_penalty > 0:
             penalty = int(self.score * (self.time_penalty / 100.0))
             self.score = max(0, self.score - penalty)
-            self.events.append(ScoreEvent(
+            self._record_event(ScoreEvent(
                 points=-penalty,
                 modifier=ScoreModifier.POOR,
                 timestamp=time_taken,
                 message=f"Time penalty: -{penalty}"
             ))
         
-        return self.get_results()
+        # Nothing can change after completion, so build the results once
+        self._final_results = self.get_results()
+        return self._final_results
     
     def get_results(self) -> Dict[str, Any]:
         """Get the scoring results"""
+        if self._final_results is not None:
+            return self._final_results
+        
         time_taken = 0.0
         if self.start_time is not None:
             time_taken = (time.time() - self.start_time) if not self.completed else \
                         (self.events[-1].timestamp if self.events else 0)
         
         # Calculate accuracy
-        total_possible = sum(max(0, event.points) * event.modifier.value 
-                           for event in self.events)
-        actual_score = sum(event.modified_points for event in self.events)
+        total_possible = self._sum_possible
+        actual_score = self._sum_actual
         accuracy = min(100.0, (actual_score / total_possible * 100)) if total_possible > 0 else 100.0
         
         return {
@@ -159,20 +188,10 @@ class ScoreSystem:
         if not self.completed:
             return ""
             
-        results = self.get_results()
-        accuracy = results['accuracy']
-        
-        if accuracy >= 99.0 and self.perfect:
-            return "S+"
-        elif accuracy >= 95.0:
-            return "S"
-        elif accuracy >= 90.0:
-            return "A"
-        elif accuracy >= 80.0:
-            return "B"
-        elif accuracy >= 70.0:
-            return "C"
-        elif accuracy >= 60.0:
-            return "D"
-        else:
-            return "F"
+        # Results are final once completed, so the grade only needs working out once
+        if self._grade is None:
+            index = bisect_right(_GRADE_THRESHOLDS, self.get_results()['accuracy'])
+            if index == len(_GRADE_THRESHOLDS) and not self.perfect:
+                index -= 1
+            self._grade = _GRADES[index]
+        return self._grade
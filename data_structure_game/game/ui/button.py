@@ -1,16 +1,29 @@
 import pygame
+from functools import lru_cache
 from typing import Optional, Callable, Tuple, Any, Dict
 from .component import UIComponent, UIEventType, UIEvent
+from .text import FontManager
+
+# Style keys that affect the rendered label surface
+_TEXT_STYLE_KEYS = frozenset({'font_name', 'font_size', 'text_color', 'padding'})
+
+@lru_cache(maxsize=256)
+def _render_text(text: str, font_name: str, font_size: int,
+                 color: Tuple[int, ...]) -> pygame.Surface:
+    """Render a label once and share the surface between buttons (blit-only)"""
+    return FontManager.get_font(font_name, font_size).render(text, True, color)
 
 class Button(UIComponent):
     """A clickable button component"""
     
+    # Only pointer events reach handle_event below
+    HANDLED_EVENT_TYPES = UIComponent.HANDLED_EVENT_TYPES
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  text: str = "", parent: Optional[UIComponent] = None):
         super().__init__(x, y, width, height, parent)
         
         self.text = text
-        self._font = pygame.font.SysFont('Arial', 16)
         self._text_surface: Optional[pygame.Surface] = None
         self._text_rect: Optional[pygame.Rect] = None
         
@@ -34,6 +47,7 @@ class Button(UIComponent):
         self._pressed = False
         self._hovered = False
         self._needs_redraw = True
+        self._text_dirty = False  # Text surface is rebuilt on the next render
         
         # Generate text surface
         self._update_text_surface()
@@ -45,13 +59,13 @@ class Button(UIComponent):
             self._text_rect = None
             return
             
-        font = pygame.font.SysFont(
-            self.styles['font_name'], 
-            self.styles['font_size']
-        )
-        
         text_color = self.styles['disabled_text_color'] if not self.enabled else self.styles['text_color']
-        self._text_surface = font.render(self.text, True, text_color)
+        self._text_surface = _render_text(
+            self.text,
+            self.styles['font_name'],
+            self.styles['font_size'],
+            tuple(text_color)
+        )
         self._text_rect = self._text_surface.get_rect()
         
         # Center the text
@@ -80,45 +94,40 @@ class Button(UIComponent):
     
     def _render_content(self, surface: pygame.Surface, abs_x: int, abs_y: int):
         """Render the button content"""
-        # Draw the button background
-        bg_rect = pygame.Rect(abs_x, abs_y, self.width, self.height)
-        border_radius = self.styles['border_radius']
+        if self._text_dirty:
+            self._update_text_surface()
+            self._text_dirty = False
+        
+        # Read styles every frame so direct edits to self.styles show up
+        styles = self.styles
+        
+        # Draw the button background (cached absolute rect, not re-allocated per frame)
+        bg_rect = self._get_abs_rect()
+        border_radius = styles['border_radius']
+        border_width = styles['border_width']
         
         # Determine the background color based on state
         if not self.enabled:
-            bg_color = self.styles['disabled_background_color']
+            bg_color = styles['disabled_background_color']
         elif self._pressed:
-            bg_color = self.styles['pressed_background_color']
+            bg_color = styles['pressed_background_color']
         elif self._hovered:
-            bg_color = self.styles['hover_background_color']
+            bg_color = styles['hover_background_color']
         else:
-            bg_color = self.styles['background_color']
+            bg_color = styles['background_color']
         
-        # Draw the background
-        if border_radius > 0:
-            pygame.draw.rect(surface, bg_color, bg_rect, 
-                           border_radius=border_radius)
-            
-            # Draw border if needed
-            if self.styles['border_width'] > 0:
-                pygame.draw.rect(
-                    surface, 
-                    self.styles['border_color'], 
-                    bg_rect, 
-                    self.styles['border_width'],
-                    border_radius=border_radius
-                )
-        else:
-            pygame.draw.rect(surface, bg_color, bg_rect)
-            
-            # Draw border if needed
-            if self.styles['border_width'] > 0:
-                pygame.draw.rect(
-                    surface, 
-                    self.styles['border_color'], 
-                    bg_rect, 
-                    self.styles['border_width']
-                )
+        # Draw the background (a border_radius of 0 draws a plain rectangle)
+        pygame.draw.rect(surface, bg_color, bg_rect, border_radius=border_radius)
+        
+        # Draw border if needed
+        if border_width > 0:
+            pygame.draw.rect(
+                surface, 
+                styles['border_color'], 
+                bg_rect, 
+                border_width,
+                border_radius=border_radius
+            )
         
         # Draw the text if it exists
         if self._text_surface and self._text_rect:
@@ -147,9 +156,9 @@ class Button(UIComponent):
                 
                 # Dispatch hover events
                 if self._hovered:
-                    self.dispatch_event(UIEvent(UIEventType.HOVER, self))
+                    self.dispatch_event(self._ui_event(UIEventType.HOVER))
                 else:
-                    self.dispatch_event(UIEvent(UIEventType.HOVER, self, {'exited': True}))
+                    self.dispatch_event(self._ui_event(UIEventType.HOVER, exited=True))
             
             return self._hovered
             
@@ -157,7 +166,7 @@ class Button(UIComponent):
             if event.button == 1 and self._hovered:  # Left mouse button
                 self._pressed = True
                 self._needs_redraw = True
-                self.dispatch_event(UIEvent(UIEventType.PRESS, self))
+                self.dispatch_event(self._ui_event(UIEventType.PRESS))
                 return True
                 
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -167,9 +176,9 @@ class Button(UIComponent):
                 
                 # Only trigger click if the mouse is still over the button
                 if self._hovered:
-                    self.dispatch_event(UIEvent(UIEventType.CLICK, self))
+                    self.dispatch_event(self._ui_event(UIEventType.CLICK))
                 
-                self.dispatch_event(UIEvent(UIEventType.RELEASE, self))
+                self.dispatch_event(self._ui_event(UIEventType.RELEASE))
                 return True
         
         return False
@@ -195,14 +204,15 @@ class Button(UIComponent):
     
     def set_style(self, **styles):
         """Set one or more style properties"""
-        needs_text_update = any(
-            k in styles for k in ['font_name', 'font_size', 'text_color', 'padding']
+        needs_text_update = not _TEXT_STYLE_KEYS.isdisjoint(styles) and any(
+            self.styles.get(k) != styles[k] for k in _TEXT_STYLE_KEYS.intersection(styles)
         )
         
         super().set_style(**styles)
         
+        # Defer rasterising so several style changes in one frame cost one render
         if needs_text_update:
-            self._update_text_surface()
+            self._text_dirty = True
     
     def set_enabled(self, enabled: bool):
         """Enable or disable the button"""
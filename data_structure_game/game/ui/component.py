@@ -1,5 +1,7 @@
 import pygame
-from typing import Optional, List, Dict, Any, Callable, Tuple
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, FrozenSet, Mapping, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -12,15 +14,40 @@ class UIEventType(Enum):
     BLUR = auto()
     CHANGE = auto()
 
-@dataclass
+# Handler method called on a component for each event type, e.g. on_click
+_EVENT_METHOD_NAMES: Dict[UIEventType, str] = {
+    event_type: f"on_{event_type.name.lower()}" for event_type in UIEventType
+}
+
+# Read-only payload of the shared hover-exit events, so no handler can alter it
+_EXITED_DATA: Mapping[str, Any] = MappingProxyType({'exited': True})
+
+@dataclass(slots=True)
 class UIEvent:
     type: UIEventType
     target: 'UIComponent'
-    data: Dict[str, Any] = None
+    data: Optional[Mapping[str, Any]] = None
 
 class UIComponent:
     """Base class for all UI components"""
     
+    # pygame event types this component can react to; subclasses extend it
+    HANDLED_EVENT_TYPES: FrozenSet[int] = frozenset({
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+    })
+    
+    # HANDLED_EVENT_TYPES, or None if the class may react to any event type
+    _event_type_filter: Optional[FrozenSet[int]] = HANDLED_EVENT_TYPES
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Event type pruning is opt-in: a class that overrides handle_event
+        # without declaring the types it handles receives every event
+        if 'HANDLED_EVENT_TYPES' in cls.__dict__:
+            cls._event_type_filter = cls.HANDLED_EVENT_TYPES
+        elif 'handle_event' in cls.__dict__:
+            cls._event_type_filter = None
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  parent: Optional['UIComponent'] = None):
         self.x = x
@@ -35,12 +62,25 @@ class UIComponent:
         self.hovered = False
         self.styles: Dict[str, Any] = {}
         self.event_listeners: Dict[UIEventType, List[Callable]] = {}
+        self._ui_events: Dict[Tuple[UIEventType, bool], UIEvent] = {}  # reusable events
         self.rect = pygame.Rect(x, y, width, height)
         self.clip_rect: Optional[pygame.Rect] = None
-        self.z_index = 0
+        self._z_index = 0
+        self._z_sorted: List['UIComponent'] = []  # children in render order
+        self._z_dirty = False
         self.tag: str = ""
+        self._find_index: Optional[Tuple[Dict[str, 'UIComponent'],
+                                         Dict[str, List['UIComponent']]]] = None
         self.id: str = ""
-        self.classes: List[str] = []
+        self.classes = ()
+        
+        # Cached absolute geometry, recomputed lazily after a move or reparent
+        self._abs_pos: Optional[Tuple[int, int]] = None
+        self._abs_rect: Optional[pygame.Rect] = None
+        
+        # Union of HANDLED_EVENT_TYPES over this subtree (None: any type), built on demand
+        self._subtree_event_types: Optional[FrozenSet[int]] = None
+        self._subtree_event_types_valid = False
         
         # Initialize default styles
         self.styles = {
@@ -54,6 +94,29 @@ class UIComponent:
             'cursor': None
         }
     
+    @property
+    def z_index(self) -> int:
+        """Stacking order among siblings; higher values render on top"""
+        return self._z_index
+    
+    @z_index.setter
+    def z_index(self, value: int):
+        if value != self._z_index:
+            self._z_index = value
+            if self.parent:
+                self.parent._z_dirty = True
+    
+    def set_z_index(self, z_index: int):
+        """Set the stacking order of this component"""
+        self.z_index = z_index
+    
+    def _get_z_sorted_children(self) -> List['UIComponent']:
+        """Children sorted by z-index, re-sorted only after a change"""
+        if self._z_dirty:
+            self._z_sorted = sorted(self.children, key=attrgetter('_z_index'))
+            self._z_dirty = False
+        return self._z_sorted
+    
     def add_event_listener(self, event_type: UIEventType, callback: Callable):
         """Add an event listener for this component"""
         if event_type not in self.event_listeners:
@@ -66,16 +129,26 @@ class UIComponent:
             if callback in self.event_listeners[event_type]:
                 self.event_listeners[event_type].remove(callback)
     
+    def _ui_event(self, event_type: UIEventType, exited: bool = False) -> UIEvent:
+        """Shared event targeting this component, built on first use"""
+        key = (event_type, exited)
+        event = self._ui_events.get(key)
+        if event is None:
+            event = UIEvent(event_type, self, _EXITED_DATA if exited else None)
+            self._ui_events[key] = event
+        return event
+    
     def dispatch_event(self, event: UIEvent):
         """Dispatch an event to this component and its listeners"""
         # Call the corresponding method if it exists
-        method_name = f"on_{event.type.name.lower()}"
-        if hasattr(self, method_name):
-            getattr(self, method_name)(event)
+        method = getattr(self, _EVENT_METHOD_NAMES[event.type], None)
+        if method is not None:
+            method(event)
         
         # Call all registered listeners
-        if event.type in self.event_listeners:
-            for callback in self.event_listeners[event.type]:
+        listeners = self.event_listeners.get(event.type)
+        if listeners:
+            for callback in listeners:
                 callback(event)
     
     def add_child(self, child: 'UIComponent'):
@@ -83,6 +156,10 @@ class UIComponent:
         if child not in self.children:
             self.children.append(child)
             child.parent = self
+            child._invalidate_abs()
+            self._z_dirty = True
+            self._invalidate_event_types()
+            self._invalidate_find_index()
             self._update_child_positions()
     
     def remove_child(self, child: 'UIComponent') -> bool:
@@ -90,6 +167,10 @@ class UIComponent:
         if child in self.children:
             self.children.remove(child)
             child.parent = None
+            child._invalidate_abs()
+            self._z_dirty = True
+            self._invalidate_event_types()
+            self._invalidate_find_index()
             return True
         return False
     
@@ -98,36 +179,95 @@ class UIComponent:
         # Basic implementation - can be overridden by layout managers
         pass
     
+    def _invalidate_abs(self):
+        """Drop the cached absolute geometry of this component and its descendants"""
+        stack = [self]
+        while stack:
+            component = stack.pop()
+            component._abs_pos = None
+            component._abs_rect = None
+            stack.extend(component.children)
+    
     def get_absolute_position(self) -> Tuple[int, int]:
         """Get the absolute position of this component"""
-        if self.parent:
-            parent_x, parent_y = self.parent.get_absolute_position()
-            return (parent_x + self.x, parent_y + self.y)
-        return (self.x, self.y)
+        pos = self._abs_pos
+        if pos is None:
+            if self.parent:
+                parent_x, parent_y = self.parent.get_absolute_position()
+                pos = (parent_x + self.x, parent_y + self.y)
+            else:
+                pos = (self.x, self.y)
+            self._abs_pos = pos
+        return pos
+    
+    def _get_abs_rect(self) -> pygame.Rect:
+        """Cached absolute rectangle; callers must not modify it"""
+        rect = self._abs_rect
+        if rect is None:
+            x, y = self.get_absolute_position()
+            rect = self._abs_rect = pygame.Rect(x, y, self.width, self.height)
+        return rect
     
     def get_absolute_rect(self) -> pygame.Rect:
         """Get the absolute rectangle of this component"""
-        x, y = self.get_absolute_position()
-        return pygame.Rect(x, y, self.width, self.height)
+        return self._get_abs_rect().copy()
     
     def point_in_component(self, point: Tuple[int, int]) -> bool:
         """Check if a point is inside this component"""
-        x, y = self.get_absolute_position()
-        return (x <= point[0] < x + self.width and 
-                y <= point[1] < y + self.height)
+        return self._get_abs_rect().collidepoint(point)
+    
+    def _get_subtree_event_types(self) -> Optional[FrozenSet[int]]:
+        """Event types that this component or any descendant can react to, None for any"""
+        if not self._subtree_event_types_valid:
+            event_types = self._event_type_filter
+            for child in self.children:
+                if event_types is None:
+                    break
+                child_types = child._get_subtree_event_types()
+                event_types = None if child_types is None else event_types | child_types
+            self._subtree_event_types = event_types
+            self._subtree_event_types_valid = True
+        return self._subtree_event_types
+    
+    def _accepts_event_type(self, event_type: int) -> bool:
+        """Whether this component or any descendant may react to the event type"""
+        event_types = self._get_subtree_event_types()
+        return event_types is None or event_type in event_types
+    
+    def _invalidate_event_types(self):
+        """Drop the cached event type sets from this component up to the root"""
+        component = self
+        while component is not None:
+            component._subtree_event_types_valid = False
+            component = component.parent
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle a pygame event. Returns True if the event was handled."""
         if not self.visible or not self.enabled:
             return False
+        
+        # Skip the tree walk for events nothing in this subtree reacts to
+        if not self._accepts_event_type(event.type):
+            return False
             
         handled = False
         
+        # Children may extend past this component, so a press can only skip
+        # them when it lands outside the clip rect they are drawn into.
+        # Motion and release still reach every child so their hover/pressed
+        # state is cleared when the mouse leaves.
+        if event.type == pygame.MOUSEBUTTONDOWN and self.clip_rect is not None:
+            mouse_pos = getattr(event, 'pos', None) or pygame.mouse.get_pos()
+            skip_children = not self.clip_rect.collidepoint(mouse_pos)
+        else:
+            skip_children = False
+        
         # Let children handle the event first (reverse order for proper z-index)
-        for child in reversed(self.children):
-            if child.handle_event(event):
-                handled = True
-                break
+        if not skip_children:
+            for child in reversed(self.children):
+                if child.handle_event(event):
+                    handled = True
+                    break
         
         if handled:
             return True
@@ -139,25 +279,25 @@ class UIComponent:
             self.hovered = self.point_in_component(mouse_pos)
             
             if self.hovered and not was_hovered:
-                self.dispatch_event(UIEvent(UIEventType.HOVER, self))
+                self.dispatch_event(self._ui_event(UIEventType.HOVER))
                 if self.styles.get('cursor'):
                     pygame.mouse.set_cursor(*pygame.cursors.tri_left)
             elif not self.hovered and was_hovered:
-                self.dispatch_event(UIEvent(UIEventType.HOVER, self, {'exited': True}))
+                self.dispatch_event(self._ui_event(UIEventType.HOVER, exited=True))
                 if self.styles.get('cursor'):
                     pygame.mouse.set_cursor(*pygame.cursors.arrow)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.hovered:  # Left mouse button
-                self.dispatch_event(UIEvent(UIEventType.PRESS, self))
+                self.dispatch_event(self._ui_event(UIEventType.PRESS))
                 if not self.focused:
                     self.set_focus(True)
                 return True
                 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1 and self.hovered:  # Left mouse button
-                self.dispatch_event(UIEvent(UIEventType.CLICK, self))
-                self.dispatch_event(UIEvent(UIEventType.RELEASE, self))
+                self.dispatch_event(self._ui_event(UIEventType.CLICK))
+                self.dispatch_event(self._ui_event(UIEventType.RELEASE))
                 return True
         
         # Handle keyboard events if focused
@@ -172,12 +312,12 @@ class UIComponent:
         if focused != self.focused:
             self.focused = focused
             if focused:
-                self.dispatch_event(UIEvent(UIEventType.FOCUS, self))
+                self.dispatch_event(self._ui_event(UIEventType.FOCUS))
                 # If this component is getting focus, notify parent to manage focus
                 if self.parent:
                     self.parent._child_got_focus(self)
             else:
-                self.dispatch_event(UIEvent(UIEventType.BLUR, self))
+                self.dispatch_event(self._ui_event(UIEventType.BLUR))
     
     def _child_got_focus(self, child: 'UIComponent'):
         """Called when a child component receives focus"""
@@ -221,7 +361,7 @@ class UIComponent:
             border_color = self.styles.get('border_color')
             
             # Draw the background
-            bg_rect = pygame.Rect(abs_x, abs_y, self.width, self.height)
+            bg_rect = self._get_abs_rect()
             if border_radius > 0:
                 pygame.draw.rect(surface, bg_color, bg_rect, 
                                border_radius=border_radius)
@@ -237,7 +377,7 @@ class UIComponent:
         self._render_content(surface, abs_x, abs_y)
         
         # Render children
-        for child in sorted(self.children, key=lambda c: c.z_index):
+        for child in self._get_z_sorted_children():
             child.render(surface)
         
         # Restore the old clip rect
@@ -247,6 +387,10 @@ class UIComponent:
         """Override this method to render the component's content"""
         pass
     
+    def _blit_source(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(surface, position) when rendering this component is exactly one blit, else None"""
+        return None
+    
     def set_style(self, **styles):
         """Set one or more style properties"""
         for key, value in styles.items():
@@ -268,6 +412,7 @@ class UIComponent:
         self.y = y
         self.rect.x = x
         self.rect.y = y
+        self._invalidate_abs()
     
     def set_size(self, width: int, height: int):
         """Set the size of this component"""
@@ -275,6 +420,7 @@ class UIComponent:
         self.height = height
         self.rect.width = width
         self.rect.height = height
+        self._abs_rect = None
         
         # Notify children of size change
         self._update_child_positions()
@@ -295,29 +441,70 @@ class UIComponent:
         """Disable the component"""
         self.enabled = False
     
+    @property
+    def id(self) -> str:
+        """Element ID used by find_by_id"""
+        return self._id
+    
+    @id.setter
+    def id(self, value: str):
+        self._id = value
+        self._invalidate_find_index()
+    
+    @property
+    def classes(self) -> Tuple[str, ...]:
+        """Class names used by find_by_class; change them via assignment or add_class/remove_class"""
+        return self._classes
+    
+    @classes.setter
+    def classes(self, value: List[str]):
+        # Stored as a tuple so every change goes through the index invalidation here
+        self._classes = tuple(value)
+        self._invalidate_find_index()
+    
+    def add_class(self, class_name: str):
+        """Add a class name to this component"""
+        if class_name not in self._classes:
+            self._classes += (class_name,)
+            self._invalidate_find_index()
+    
+    def remove_class(self, class_name: str):
+        """Remove a class name from this component"""
+        if class_name in self._classes:
+            index = self._classes.index(class_name)
+            self._classes = self._classes[:index] + self._classes[index + 1:]
+            self._invalidate_find_index()
+    
+    def _invalidate_find_index(self):
+        """Drop the cached id/class indices from this component up to the root"""
+        component = self
+        while component is not None:
+            component._find_index = None
+            component = component.parent
+    
+    def _get_find_index(self) -> Tuple[Dict[str, 'UIComponent'], Dict[str, List['UIComponent']]]:
+        """ID and class indices over this subtree, built in depth-first order"""
+        index = self._find_index
+        if index is None:
+            ids: Dict[str, UIComponent] = {}
+            classes: Dict[str, List[UIComponent]] = {}
+            stack = [self]
+            while stack:
+                component = stack.pop()
+                ids.setdefault(component._id, component)
+                for class_name in component._classes:
+                    classes.setdefault(class_name, []).append(component)
+                stack.extend(reversed(component.children))
+            index = self._find_index = (ids, classes)
+        return index
+    
     def find_by_id(self, element_id: str) -> Optional['UIComponent']:
         """Find a child component by ID"""
-        if self.id == element_id:
-            return self
-            
-        for child in self.children:
-            found = child.find_by_id(element_id)
-            if found:
-                return found
-                
-        return None
+        return self._get_find_index()[0].get(element_id)
     
     def find_by_class(self, class_name: str) -> List['UIComponent']:
         """Find all child components with the given class name"""
-        result = []
-        
-        if class_name in self.classes:
-            result.append(self)
-            
-        for child in self.children:
-            result.extend(child.find_by_class(class_name))
-            
-        return result
+        return list(self._get_find_index()[1].get(class_name, ()))
     
     def __str__(self) -> str:
         return f"<{self.__class__.__name__} id='{self.id}'>"
@@ -1,14 +1,19 @@
 import pygame
 import math
-from typing import List, Dict, Tuple, Optional, Any, Type, Union, Callable
+import heapq
+import itertools
+from collections import deque
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Any, Type, Union, Callable, Set
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from ..core.data_structures import (
     DataStructure, Stack, Queue, LinkedList, BinaryTree, Graph,
     LinkedListNode, BinaryTreeNode, OperationType
 )
 from .component import UIComponent, UIEvent, UIEventType
-from .text import Text
+from .text import Text, FontManager
 
 # Constants for drawing
 NODE_RADIUS = 20
@@ -27,10 +32,111 @@ EDGE_ARROW_SIZE = 8
 HIGHLIGHT_COLOR = (255, 200, 0)
 HIGHLIGHT_WIDTH = 3
 
+# Angle between successive seed positions of the graph layout (radians)
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+# Whether nodes of a type are identified by value (primitives) or by id(),
+# filled in on first sight of each type
+_ID_BY_VALUE: Dict[type, bool] = {}
+
 # Animation constants
 ANIMATION_SPEED = 0.1
 HIGHLIGHT_DURATION = 1000  # ms
 
+# Graph layout simulation: maximum iterations, and the per-iteration movement
+# (px) below which the layout counts as settled
+LAYOUT_ITERATIONS = 50
+LAYOUT_TOLERANCE = 0.25
+
+@lru_cache(maxsize=256)
+def _render_label(text: str, font_name: str, font_size: int,
+                  color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a node label once and reuse the surface across frames and views"""
+    return FontManager.get_font(font_name, font_size).render(text, True, color)
+
+@lru_cache(maxsize=64)
+def _render_node_sprite(radius: int, fill_color: Tuple[int, int, int],
+                        border_color: Tuple[int, int, int], border_width: int) -> pygame.Surface:
+    """Filled, bordered node circle centred at (radius, radius), drawn once per style"""
+    sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, fill_color, (radius, radius), radius)
+    if border_width > 0:
+        pygame.draw.circle(sprite, border_color, (radius, radius), radius, border_width)
+    return sprite
+
+@lru_cache(maxsize=None)
+def _layout_kernel():
+    """JIT-compiled force-directed layout kernel, or None when numba is not installed"""
+    try:
+        from .view_kernels import force_directed_layout
+    except ImportError:
+        return None
+    return force_directed_layout
+
+@lru_cache(maxsize=None)
+def _ease_kernel():
+    """JIT-compiled easing step, or None when numba is not installed"""
+    try:
+        from .view_kernels import ease_step
+    except ImportError:
+        return None
+    return ease_step
+
+def _arrow_geometry(coords: np.ndarray, arrow_len: float, radius: float) -> np.ndarray:
+    """Rows of (x1, y1, x2, y2, x3, y3, x4, y4): edge line, then arrowhead corners"""
+    x1, y1, x2, y2 = coords.T
+    dx = x2 - x1
+    dy = y2 - y1
+    angle = np.arctan2(dy, dx)
+    arrow_angle = math.pi / 6  # 30 degrees
+    
+    # Calculate arrow points
+    x3 = x2 - arrow_len * np.cos(angle - arrow_angle)
+    y3 = y2 - arrow_len * np.sin(angle - arrow_angle)
+    x4 = x2 - arrow_len * np.cos(angle + arrow_angle)
+    y4 = y2 - arrow_len * np.sin(angle + arrow_angle)
+    
+    # Adjust line end to account for node radius (y uses the length measured
+    # after x has been pulled in)
+    end_x = x1 + dx * (1 - radius / np.maximum(1, np.hypot(dx, dy)))
+    end_y = y1 + dy * (1 - radius / np.maximum(1, np.hypot(end_x - x1, dy)))
+    
+    return np.column_stack((x1, y1, end_x, end_y, x3, y3, x4, y4))
+
+def _force_directed_layout(pos: np.ndarray, edges: np.ndarray, width: float, height: float,
+                           radius: float, iterations: int, tolerance: float = 0.0) -> np.ndarray:
+    """Run the force-directed simulation on an (n, 2) array of node positions"""
+    pos = pos.copy()
+    kernel = _layout_kernel()
+    if kernel is not None:
+        return kernel(pos, edges, float(width), float(height), float(radius), iterations,
+                      float(tolerance))
+    
+    lower = (radius, radius)
+    upper = (width - radius, height - radius)
+    src, dst = edges[:, 0], edges[:, 1]
+    
+    for _ in range(iterations):
+        previous = pos.copy()
+        
+        # Repulsive forces between every pair (inverse square law), split evenly
+        delta = pos[None, :, :] - pos[:, None, :]  # delta[i, j] = pos[j] - pos[i]
+        dist = np.maximum(0.1, np.sqrt((delta * delta).sum(axis=-1)))
+        pos -= 0.5 * (delta * (1000.0 / dist ** 3)[..., None]).sum(axis=1)
+        np.maximum(np.minimum(pos, upper, out=pos), lower, out=pos)
+        
+        # Attractive forces (springs for edges)
+        spring = 0.01 * (pos[dst] - pos[src])
+        np.add.at(pos, src, spring)
+        np.subtract.at(pos, dst, spring)
+        np.maximum(np.minimum(pos, upper, out=pos), lower, out=pos)
+        
+        # Stop once no node moves more than the tolerance in an iteration
+        if np.abs(pos - previous).max() < tolerance:
+            break
+    
+    return pos
+
 class LayoutDirection(Enum):
     HORIZONTAL = "horizontal"
     VERTICAL = "vertical"
@@ -61,15 +167,26 @@ class EdgeStyle:
 @dataclass
 class AnimationState:
     """State for node/edge animations"""
-    node_pos: Dict[Any, Tuple[float, float]]  # Target positions for nodes
+    node_rows: Dict[Any, int]  # Node IDs with their row in node_pos/node_target
     edge_points: Dict[Tuple[Any, Any], List[Tuple[float, float]]]  # Points for edges
     highlight_nodes: Dict[Any, int]  # Node IDs with highlight end time
-    highlight_edges: Dict[Tuple[Any, Any], int]  # Edge IDs with highlight end time
+    highlight_edges: Dict[Tuple[Any, Any], int]  # Edge keys (see _edge_key) with highlight end time
+    # (end time, sequence, highlight dict, key) min-heap over both highlight dicts;
+    # entries for keys re-highlighted since are stale and skipped on pop
+    highlight_heap: List[Tuple[int, int, Dict, Any]] = field(default_factory=list)
     current_time: int = 0
+    # Current and target (x, y) per node row; rows from node_count on are spare capacity
+    node_pos: np.ndarray = field(default_factory=lambda: np.zeros((16, 2)))
+    node_target: np.ndarray = field(default_factory=lambda: np.zeros((16, 2)))
+    node_count: int = 0
+    moving_rows: Set[int] = field(default_factory=set)  # Rows not yet at their target
 
 class DataStructureView(UIComponent):
     """A component for visualizing data structures"""
     
+    # Only pointer events reach handle_event below
+    HANDLED_EVENT_TYPES = UIComponent.HANDLED_EVENT_TYPES
+    
     def __init__(self, x: int, y: int, width: int, height: int,
                  data_structure: Optional[DataStructure] = None,
                  layout: LayoutDirection = LayoutDirection.HORIZONTAL,
@@ -88,13 +205,36 @@ class DataStructureView(UIComponent):
         
         # Animation state
         self._animation_state = AnimationState(
-            node_pos={},
+            node_rows={},
             edge_points={},
             highlight_nodes={},
             highlight_edges={}
         )
         self._last_update = 0
+        self._highlight_seq = itertools.count()  # tie-breaker for highlight_heap
         self._is_animating = False
+        self._needs_redraw = True
+        
+        # Last rendered frame, reblitted while nothing that affects it changes
+        self._frame_cache: Optional[pygame.Surface] = None
+        self._frame_key: Optional[Tuple] = None
+        self._frame_styles: Optional[Tuple[NodeStyle, EdgeStyle]] = None
+        
+        # Node/edge lists, rebuilt only when the data structure's version changes
+        self._nodes_cache: List[Any] = []
+        self._edges_cache: List[Tuple[Any, Any]] = []
+        self._topology_version: Optional[int] = None
+        
+        # Inputs and result of the last graph layout, to skip re-running it
+        self._graph_layout_key: Optional[Tuple] = None
+        self._graph_layout_pos: Optional[np.ndarray] = None
+        
+        # Uniform grid of node positions for hit testing, rebuilt after nodes move
+        self._node_grid: Optional[Dict[Tuple[int, int], List[Tuple[int, Any, float, float]]]] = None
+        self._node_grid_key: Optional[Tuple[Optional[int], int]] = None
+        
+        # Per-edge (quantised endpoints and style, points) from the last update
+        self._edge_cache: Dict[Tuple[Any, Any], Tuple[Tuple, List[Tuple[float, float]]]] = {}
         
         # Interaction state
         self._hovered_node = None
@@ -120,6 +260,8 @@ class DataStructureView(UIComponent):
         """Set the data structure to visualize"""
         if self._data_structure != ds:
             self._data_structure = ds
+            self._topology_version = None
+            self._needs_redraw = True
             self._update_layout()
     
     @property
@@ -136,9 +278,13 @@ class DataStructureView(UIComponent):
     
     def _update_layout(self):
         """Update the layout of nodes and edges based on the data structure"""
+        self._needs_redraw = True
         if not self._data_structure:
-            self._animation_state.node_pos = {}
+            self._animation_state.node_rows = {}
+            self._animation_state.node_count = 0
+            self._animation_state.moving_rows.clear()
             self._animation_state.edge_points = {}
+            self._node_grid = None
             self._is_animating = False
             return
         
@@ -160,7 +306,7 @@ class DataStructureView(UIComponent):
         self._update_edge_positions()
         
         # Check if we need to animate
-        self._check_animation_state()
+        self._check_animation_state(current_time)
     
     def _update_horizontal_layout(self):
         """Arrange nodes in a horizontal line"""
@@ -229,10 +375,10 @@ class DataStructureView(UIComponent):
             level_heights.append(int(self.node_style.radius + i * level_height))
         
         # Position nodes using a breadth-first traversal
-        queue = [(root, 0, 0, self.width)]  # (node, level, left, right)
+        queue = deque([(root, 0, 0, self.width)])  # (node, level, left, right)
         
         while queue:
-            node, level, left, right = queue.pop(0)
+            node, level, left, right = queue.popleft()
             
             # Calculate position
             x = (left + right) // 2
@@ -260,75 +406,46 @@ class DataStructureView(UIComponent):
         if not nodes:
             return
         
-        # Initialize positions randomly if not set
-        for node in nodes:
-            if self._get_node_id(node) not in self._animation_state.node_pos:
-                x = self.node_style.radius + (self.width - 2 * self.node_style.radius) * (hash(str(node)) % 100) / 100
-                y = self.node_style.radius + (self.height - 2 * self.node_style.radius) * (hash(str(node) + "y") % 100) / 100
-                self._set_node_position(self._get_node_id(node), x, y, immediate=True)
-        
-        # Simple force-directed layout simulation
-        for _ in range(50):  # Number of iterations
-            # Repulsive forces
-            for i, node1 in enumerate(nodes):
-                id1 = self._get_node_id(node1)
-                x1, y1 = self._get_node_position(id1)
-                
-                for j in range(i + 1, len(nodes)):
-                    node2 = nodes[j]
-                    id2 = self._get_node_id(node2)
-                    x2, y2 = self._get_node_position(id2)
-                    
-                    # Calculate distance
-                    dx = x2 - x1
-                    dy = y2 - y1
-                    dist = max(0.1, (dx * dx + dy * dy) ** 0.5)
-                    
-                    # Apply repulsive force (inverse square law)
-                    force = 1000 / (dist * dist)
-                    fx = force * dx / dist
-                    fy = force * dy / dist
-                    
-                    # Update positions
-                    self._animation_state.node_pos[id1] = (
-                        max(self.node_style.radius, min(self.width - self.node_style.radius, x1 - fx * 0.5)),
-                        max(self.node_style.radius, min(self.height - self.node_style.radius, y1 - fy * 0.5))
-                    )
-                    
-                    self._animation_state.node_pos[id2] = (
-                        max(self.node_style.radius, min(self.width - self.node_style.radius, x2 + fx * 0.5)),
-                        max(self.node_style.radius, min(self.height - self.node_style.radius, y2 + fy * 0.5))
-                    )
-            
-            # Attractive forces (springs for edges)
-            for node1, neighbors in self._data_structure.adjacency_list.items():
-                id1 = self._get_node_id(node1)
-                x1, y1 = self._get_node_position(id1)
-                
-                for node2 in neighbors:
-                    id2 = self._get_node_id(node2)
-                    x2, y2 = self._get_node_position(id2)
-                    
-                    # Calculate distance
-                    dx = x2 - x1
-                    dy = y2 - y1
-                    dist = max(0.1, (dx * dx + dy * dy) ** 0.5)
-                    
-                    # Apply attractive force (spring)
-                    force = 0.01 * dist
-                    fx = force * dx / dist
-                    fy = force * dy / dist
-                    
-                    # Update positions
-                    self._animation_state.node_pos[id1] = (
-                        max(self.node_style.radius, min(self.width - self.node_style.radius, x1 + fx)),
-                        max(self.node_style.radius, min(self.height - self.node_style.radius, y1 + fy))
-                    )
-                    
-                    self._animation_state.node_pos[id2] = (
-                        max(self.node_style.radius, min(self.width - self.node_style.radius, x2 - fx)),
-                        max(self.node_style.radius, min(self.height - self.node_style.radius, y2 - fy))
-                    )
+        # Seed unplaced nodes on a golden-angle spiral around the centre: evenly
+        # spread, deterministic, and placed nodes keep their position
+        n = len(nodes)
+        center_x = self.width / 2
+        center_y = self.height / 2
+        spread = max(0, min(self.width, self.height) / 2 - self.node_style.radius)
+        for i, node in enumerate(nodes):
+            node_id = self._get_node_id(node)
+            if node_id not in self._animation_state.node_rows:
+                theta = i * GOLDEN_ANGLE
+                r = spread * math.sqrt((i + 0.5) / n)
+                self._set_node_position(node_id, center_x + r * math.cos(theta),
+                                        center_y + r * math.sin(theta), immediate=True)
+        
+        # Simple force-directed layout simulation over the nodes' position rows
+        state = self._animation_state
+        node_rows = np.array([state.node_rows[self._get_node_id(node)] for node in nodes],
+                             dtype=np.intp)
+        rows = {node: i for i, node in enumerate(nodes)}
+        edges = np.array([
+            (rows[node1], rows[node2])
+            for node1, neighbors in self._data_structure.adjacency_list.items()
+            for node2 in neighbors
+        ], dtype=np.intp).reshape(-1, 2)
+        
+        # Nothing to do if the graph, the view and the nodes are as the last run left them
+        key = (node_rows.tobytes(), edges.tobytes(), self.width, self.height, self.node_style.radius)
+        start = state.node_pos[node_rows]
+        if key == self._graph_layout_key and np.array_equal(start, self._graph_layout_pos):
+            return
+        
+        pos = _force_directed_layout(start, edges, self.width, self.height,
+                                     self.node_style.radius, LAYOUT_ITERATIONS, LAYOUT_TOLERANCE)
+        self._graph_layout_key = key
+        self._graph_layout_pos = pos
+        
+        state.node_pos[node_rows] = pos
+        state.node_target[node_rows] = pos
+        state.moving_rows.difference_update(node_rows.tolist())
+        self._node_grid = None
     
     def _update_edge_positions(self):
         """Update the positions of all edges based on node positions"""
@@ -338,6 +455,12 @@ class DataStructureView(UIComponent):
         
         edges = self._get_edges()
         edge_points = {}
+        edge_cache = {}
+        pending: List[Tuple[Tuple[Any, Any], Tuple]] = []  # directed edges to recompute
+        coords: List[Tuple[float, float, float, float]] = []
+        directed = self.edge_style.directed
+        arrow_size = self.edge_style.arrow_size
+        node_radius = self.node_style.radius
         
         for edge in edges:
             node1, node2 = edge
@@ -348,37 +471,54 @@ class DataStructureView(UIComponent):
             x1, y1 = self._get_node_position(id1)
             x2, y2 = self._get_node_position(id2)
             
-            # Calculate edge points (with arrow for directed edges)
-            if self.edge_style.directed:
-                # Calculate arrow points
-                angle = math.atan2(y2 - y1, x2 - x1)
-                arrow_len = self.edge_style.arrow_size
-                arrow_angle = math.pi / 6  # 30 degrees
-                
-                # Calculate arrow points
-                x3 = x2 - arrow_len * math.cos(angle - arrow_angle)
-                y3 = y2 - arrow_len * math.sin(angle - arrow_angle)
-                x4 = x2 - arrow_len * math.cos(angle + arrow_angle)
-                y4 = y2 - arrow_len * math.sin(angle + arrow_angle)
-                
-                # Adjust line end to account for node radius
-                radius = self.node_style.radius
-                x2 = x1 + (x2 - x1) * (1 - radius / max(1, ((x2-x1)**2 + (y2-y1)**2)**0.5))
-                y2 = y1 + (y2 - y1) * (1 - radius / max(1, ((x2-x1)**2 + (y2-y1)**2)**0.5))
-                
-                edge_points[edge] = [(x1, y1), (x2, y2), (x3, y3), (x4, y4)]
+            # Reuse last frame's points while neither endpoint moved a whole pixel
+            key = (int(x1), int(y1), int(x2), int(y2), directed, arrow_size, node_radius)
+            cached = self._edge_cache.get(edge)
+            if cached is not None and cached[0] == key:
+                edge_points[edge] = cached[1]
+                edge_cache[edge] = cached
+                continue
+            
+            # Calculate edge points (arrows for directed edges are done in one batch below)
+            if directed:
+                pending.append((edge, key))
+                coords.append((x1, y1, x2, y2))
             else:
-                edge_points[edge] = [(x1, y1), (x2, y2)]
-        
+                points = [(x1, y1), (x2, y2)]
+                edge_points[edge] = points
+                edge_cache[edge] = (key, points)
+        
+        if pending:
+            geometry = _arrow_geometry(np.array(coords, dtype=np.float64),
+                                       arrow_size, node_radius).tolist()
+            for (edge, key), (x1, y1, x2, y2, x3, y3, x4, y4) in zip(pending, geometry):
+                points = [(x1, y1), (x2, y2), (x3, y3), (x4, y4)]
+                edge_points[edge] = points
+                edge_cache[edge] = (key, points)
+        
+        self._edge_cache = edge_cache
         self._animation_state.edge_points = edge_points
     
+    def _refresh_topology(self):
+        """Rebuild the cached node and edge lists if the data structure changed"""
+        version = self._data_structure.version
+        if version != self._topology_version:
+            self._nodes_cache = self._collect_nodes()
+            self._edges_cache = self._collect_edges()
+            self._topology_version = version
+    
     def _get_nodes(self) -> List[Any]:
-        """Get a list of nodes in the data structure"""
+        """Get a list of nodes in the data structure (cached; do not modify)"""
         if not self._data_structure:
             return []
         
+        self._refresh_topology()
+        return self._nodes_cache
+    
+    def _collect_nodes(self) -> List[Any]:
+        """Walk the data structure and list its nodes"""
         if isinstance(self._data_structure, (Stack, Queue)):
-            return self._data_structure.elements
+            return list(self._data_structure.elements)
         elif isinstance(self._data_structure, LinkedList):
             nodes = []
             current = self._data_structure.head
@@ -397,18 +537,26 @@ class DataStructureView(UIComponent):
     
     def _collect_tree_nodes(self, node: Optional[BinaryTreeNode], nodes: List[BinaryTreeNode]):
         """Collect all nodes in a binary tree using in-order traversal"""
-        if not node:
-            return
-        
-        self._collect_tree_nodes(node.left, nodes)
-        nodes.append(node)
-        self._collect_tree_nodes(node.right, nodes)
+        stack = []
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                nodes.append(node)
+                node = node.right
     
     def _get_edges(self) -> List[Tuple[Any, Any]]:
-        """Get a list of edges in the data structure"""
+        """Get a list of edges in the data structure (cached; do not modify)"""
         if not self._data_structure:
             return []
         
+        self._refresh_topology()
+        return self._edges_cache
+    
+    def _collect_edges(self) -> List[Tuple[Any, Any]]:
+        """Walk the data structure and list its edges"""
         edges = []
         
         if isinstance(self._data_structure, (Stack, Queue)):
@@ -425,10 +573,12 @@ class DataStructureView(UIComponent):
             self._collect_tree_edges(self._data_structure.root, edges)
         elif isinstance(self._data_structure, Graph):
             # Add all graph edges
+            seen = set()
             for node, neighbors in self._data_structure.adjacency_list.items():
                 for neighbor in neighbors:
                     # Only add each edge once for undirected graphs
-                    if (neighbor, node) not in edges:
+                    if (neighbor, node) not in seen:
+                        seen.add((node, neighbor))
                         edges.append((node, neighbor))
         
         return edges
@@ -438,110 +588,192 @@ class DataStructureView(UIComponent):
         if not node:
             return
         
-        if node.left:
-            edges.append((node, node.left))
-            self._collect_tree_edges(node.left, edges)
-        
+        # Pre-order over (parent, child) pairs; right is pushed first so left pops first
+        stack = []
         if node.right:
-            edges.append((node, node.right))
-            self._collect_tree_edges(node.right, edges)
+            stack.append((node, node.right))
+        if node.left:
+            stack.append((node, node.left))
+        
+        while stack:
+            edge = stack.pop()
+            edges.append(edge)
+            child = edge[1]
+            if child.right:
+                stack.append((child, child.right))
+            if child.left:
+                stack.append((child, child.left))
     
     def _get_node_id(self, node: Any) -> Any:
         """Get a unique identifier for a node"""
-        # For primitive types, use the value itself as ID
-        if isinstance(node, (int, float, str, bool)) or node is None:
-            return node
+        node_type = type(node)
+        by_value = _ID_BY_VALUE.get(node_type)
+        if by_value is None:
+            by_value = _ID_BY_VALUE[node_type] = isinstance(node, (int, float, str, bool)) or node is None
         
-        # For objects, use their memory address
-        return id(node)
+        # Primitive types use the value itself as ID, objects their memory address
+        return node if by_value else id(node)
     
     def _get_node_position(self, node_id: Any) -> Tuple[float, float]:
         """Get the current position of a node"""
-        if node_id in self._animation_state.node_pos:
-            return self._animation_state.node_pos[node_id]
+        row = self._animation_state.node_rows.get(node_id)
+        if row is not None:
+            x, y = self._animation_state.node_pos[row].tolist()
+            return (x, y)
         
         # Default position (center)
         return (self.width // 2, self.height // 2)
     
+    def _add_node_row(self, node_id: Any) -> int:
+        """Allocate a position row for a node, growing the arrays when full"""
+        state = self._animation_state
+        if state.node_count == len(state.node_pos):
+            spare = np.zeros((max(16, state.node_count), 2))
+            state.node_pos = np.concatenate((state.node_pos, spare))
+            state.node_target = np.concatenate((state.node_target, spare))
+        
+        row = state.node_count
+        state.node_rows[node_id] = row
+        state.node_count += 1
+        return row
+    
     def _set_node_position(self, node_id: Any, x: float, y: float, immediate: bool = False):
         """Set the position of a node"""
+        self._node_grid = None
+        self._needs_redraw = True
+        state = self._animation_state
+        row = state.node_rows.get(node_id)
+        if row is None:
+            # New nodes appear in place rather than sliding in
+            row = self._add_node_row(node_id)
+            immediate = True
+        
+        # Otherwise _update_animation eases the node towards its target
+        state.node_target[row] = (x, y)
         if immediate:
-            self._animation_state.node_pos[node_id] = (x, y)
+            state.node_pos[row] = (x, y)
+            state.moving_rows.discard(row)
         else:
-            # Smooth animation to the new position
-            if node_id in self._animation_state.node_pos:
-                current_x, current_y = self._animation_state.node_pos[node_id]
-                self._animation_state.node_pos[node_id] = (
-                    current_x + (x - current_x) * ANIMATION_SPEED,
-                    current_y + (y - current_y) * ANIMATION_SPEED
-                )
-            else:
-                self._animation_state.node_pos[node_id] = (x, y)
+            state.moving_rows.add(row)
     
     def _calculate_tree_depth(self, node: Any, current_depth: int = 0) -> int:
         """Calculate the depth of a tree"""
-        if not node:
-            return current_depth
+        max_depth = current_depth
+        stack = [(node, current_depth + 1)] if node else []
         
-        if isinstance(node, BinaryTreeNode):
-            return max(
-                self._calculate_tree_depth(node.left, current_depth + 1),
-                self._calculate_tree_depth(node.right, current_depth + 1)
-            )
-        elif isinstance(node, LinkedListNode):
-            return self._calculate_tree_depth(node.next, current_depth + 1)
-        else:
-            return current_depth + 1
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            
+            if isinstance(node, BinaryTreeNode):
+                if node.left:
+                    stack.append((node.left, depth + 1))
+                if node.right:
+                    stack.append((node.right, depth + 1))
+            elif isinstance(node, LinkedListNode):
+                if node.next:
+                    stack.append((node.next, depth + 1))
+        
+        return max_depth
     
-    def _check_animation_state(self):
+    def _check_animation_state(self, current_time: Optional[int] = None):
         """Check if any animations are in progress"""
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        
         self._is_animating = False
         
         # Check node positions
-        for node_id, (x, y) in self._animation_state.node_pos.items():
-            target_x, target_y = self._get_node_position(node_id)
-            if abs(x - target_x) > 0.1 or abs(y - target_y) > 0.1:
-                self._is_animating = True
-                break
-        
-        # Check highlights
-        current_time = pygame.time.get_ticks()
-        if any(end_time > current_time for end_time in self._animation_state.highlight_nodes.values()):
+        if self._animation_state.moving_rows:
             self._is_animating = True
         
-        if any(end_time > current_time for end_time in self._animation_state.highlight_edges.values()):
+        # Check highlights; after expiring old ones, any left are still running
+        self._expire_highlights(current_time)
+        if self._animation_state.highlight_nodes or self._animation_state.highlight_edges:
             self._is_animating = True
     
+    def _expire_highlights(self, current_time: int):
+        """Remove highlights whose end time has passed"""
+        heap = self._animation_state.highlight_heap
+        while heap and heap[0][0] <= current_time:
+            end_time, _, highlights, key = heapq.heappop(heap)
+            if highlights.get(key) == end_time:
+                del highlights[key]
+                # The cached frame still shows the highlight
+                self._needs_redraw = True
+    
+    def _add_highlight(self, highlights: Dict, key: Any, duration: int):
+        """Record a highlight in the given dict and schedule its expiry"""
+        end_time = pygame.time.get_ticks() + duration
+        highlights[key] = end_time
+        heapq.heappush(self._animation_state.highlight_heap,
+                       (end_time, next(self._highlight_seq), highlights, key))
+    
     def highlight_node(self, node: Any, duration: int = HIGHLIGHT_DURATION):
         """Highlight a node for a specified duration"""
         node_id = self._get_node_id(node)
-        self._animation_state.highlight_nodes[node_id] = pygame.time.get_ticks() + duration
+        self._add_highlight(self._animation_state.highlight_nodes, node_id, duration)
         self._is_animating = True
     
     def highlight_edge(self, node1: Any, node2: Any, duration: int = HIGHLIGHT_DURATION):
         """Highlight an edge for a specified duration"""
-        edge = (self._get_node_id(node1), self._get_node_id(node2))
-        self._animation_state.highlight_edges[edge] = pygame.time.get_ticks() + duration
+        edge = self._edge_key(self._get_node_id(node1), self._get_node_id(node2))
+        self._add_highlight(self._animation_state.highlight_edges, edge, duration)
         self._is_animating = True
     
+    def _edge_key(self, id1: Any, id2: Any) -> Tuple[Any, Any]:
+        """Direction-independent key for the edge between two node IDs"""
+        try:
+            swap = id2 < id1
+        except TypeError:
+            # Unorderable pair (mixed types, None); order by type name, then hash
+            swap = (type(id2).__name__, hash(id2)) < (type(id1).__name__, hash(id1))
+        return (id2, id1) if swap else (id1, id2)
+    
     def _render_content(self, surface: pygame.Surface, abs_x: int, abs_y: int):
         """Render the data structure visualization"""
         if not self._data_structure:
             return
         
-        # Update animation state
-        self._update_animation()
-        
-        # Draw edges first (behind nodes)
-        self._draw_edges(surface, abs_x, abs_y)
+        # Redraw only when something visible may have changed; a static view
+        # just blits the previous frame
+        key = (self._data_structure.version, self.width, self.height,
+               self.highlight_color, self.highlight_width)
+        if (self._is_animating or self._needs_redraw or self._frame_cache is None
+                or key != self._frame_key
+                or self._frame_styles != (self.node_style, self.edge_style)):
+            # One clock read per frame, shared by the animation update and drawing
+            current_time = pygame.time.get_ticks()
+            self._animation_state.current_time = current_time
+            
+            # Update animation state
+            self._update_animation(current_time)
+            
+            frame = self._frame_cache
+            if frame is None or frame.get_size() != (self.width, self.height):
+                frame = self._frame_cache = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            frame.fill((0, 0, 0, 0))
+            
+            # Draw edges first (behind nodes)
+            self._draw_edges(frame, 0, 0, current_time)
+            
+            # Then draw nodes (on top of edges)
+            self._draw_nodes(frame, 0, 0, current_time)
+            
+            self._frame_key = key
+            self._frame_styles = (replace(self.node_style), replace(self.edge_style))
+            self._needs_redraw = False
         
-        # Then draw nodes (on top of edges)
-        self._draw_nodes(surface, abs_x, abs_y)
+        surface.blit(self._frame_cache, (abs_x, abs_y))
     
-    def _draw_nodes(self, surface: pygame.Surface, offset_x: int, offset_y: int):
+    def _draw_nodes(self, surface: pygame.Surface, offset_x: int, offset_y: int,
+                    current_time: Optional[int] = None):
         """Draw all nodes in the data structure"""
         nodes = self._get_nodes()
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        blits = []
         
         for node in nodes:
             node_id = self._get_node_id(node)
@@ -555,21 +787,22 @@ class DataStructureView(UIComponent):
                 self._animation_state.highlight_nodes[node_id] > current_time
             )
             
-            # Draw the node
-            self._draw_node(
-                surface,
+            # Queue the node; sprites and labels stay interleaved so overlaps draw as before
+            blits.extend(self._node_blits(
                 int(offset_x + x),
                 int(offset_y + y),
                 str(getattr(node, 'value', node)),
                 is_hovered,
                 is_selected,
                 is_highlighted
-            )
+            ))
+        
+        surface.blits(blits, False)
     
-    def _draw_node(self, surface: pygame.Surface, x: int, y: int, label: str,
-                  is_hovered: bool = False, is_selected: bool = False,
-                  is_highlighted: bool = False):
-        """Draw a single node"""
+    def _node_blits(self, x: int, y: int, label: str, is_hovered: bool = False,
+                    is_selected: bool = False, is_highlighted: bool = False
+                    ) -> List[Tuple[pygame.Surface, Any]]:
+        """(surface, position) pairs that draw a single node"""
         # Determine colors
         if is_highlighted:
             fill_color = self.highlight_color
@@ -584,152 +817,94 @@ class DataStructureView(UIComponent):
             fill_color = self.node_style.color
             border_color = self.node_style.border_color
         
-        # Draw the node circle
-        pygame.draw.circle(
-            surface,
-            fill_color,
-            (x, y),
-            self.node_style.radius
-        )
-        
-        # Draw the border
-        if self.node_style.border_width > 0:
-            pygame.draw.circle(
-                surface,
-                border_color,
-                (x, y),
-                self.node_style.radius,
-                self.node_style.border_width
-            )
+        # The node circle and border, pre-rendered once per style
+        radius = self.node_style.radius
+        # Styles may hold lists or pygame.Color; the sprite cache needs hashable keys
+        sprite = _render_node_sprite(radius, tuple(fill_color), tuple(border_color),
+                                     self.node_style.border_width)
+        blits = [(sprite, (x - radius, y - radius))]
         
-        # Draw the label
+        # The label
         if label:
-            font = pygame.font.SysFont(self.node_style.font_name, self.node_style.text_size)
-            text_surface = font.render(str(label), True, self.node_style.text_color)
-            text_rect = text_surface.get_rect(center=(x, y))
-            surface.blit(text_surface, text_rect)
+            text_surface = _render_label(str(label), self.node_style.font_name,
+                                         self.node_style.text_size, tuple(self.node_style.text_color))
+            blits.append((text_surface, text_surface.get_rect(center=(x, y))))
+        
+        return blits
     
-    def _draw_edges(self, surface: pygame.Surface, offset_x: int, offset_y: int):
+    def _draw_edges(self, surface: pygame.Surface, offset_x: int, offset_y: int,
+                    current_time: Optional[int] = None):
         """Draw all edges in the data structure"""
         edges = self._get_edges()
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        edge_points = self._animation_state.edge_points
+        highlight_edges = self._animation_state.highlight_edges
+        directed = self.edge_style.directed
+        edge_color = self.edge_style.color
+        edge_width = self.edge_style.width
+        draw_line = pygame.draw.line
+        draw_polygon = pygame.draw.polygon
         
         for edge in edges:
+            # Get the edge points from the animation state
+            points = edge_points.get(edge)
+            if points is None:
+                continue
+            
             node1, node2 = edge
-            id1 = self._get_node_id(node1)
-            id2 = self._get_node_id(node2)
             
-            # Check if edge is highlighted
-            is_highlighted = (
-                (id1, id2) in self._animation_state.highlight_edges and 
-                self._animation_state.highlight_edges[(id1, id2)] > current_time
-            ) or (
-                (id2, id1) in self._animation_state.highlight_edges and 
-                self._animation_state.highlight_edges[(id2, id1)] > current_time
-            )
+            # Check if edge is highlighted (in either direction)
+            key = self._edge_key(self._get_node_id(node1), self._get_node_id(node2))
+            if highlight_edges.get(key, current_time) > current_time:
+                color, width = self.highlight_color, self.highlight_width
+            else:
+                color, width = edge_color, edge_width
             
-            # Get the edge points from the animation state
-            if edge in self._animation_state.edge_points:
-                points = self._animation_state.edge_points[edge]
-                
-                # Draw the edge line
-                if len(points) >= 2:
-                    self._draw_edge(
-                        surface,
-                        points[0][0] + offset_x,
-                        points[0][1] + offset_y,
-                        points[1][0] + offset_x,
-                        points[1][1] + offset_y,
-                        is_highlighted
-                    )
-                
-                # Draw the arrow for directed edges
-                if self.edge_style.directed and len(points) >= 4:
-                    self._draw_arrow(
-                        surface,
-                        points[1][0] + offset_x,
-                        points[1][1] + offset_y,
-                        points[2][0] + offset_x,
-                        points[2][1] + offset_y,
-                        points[3][0] + offset_x,
-                        points[3][1] + offset_y,
-                        is_highlighted
-                    )
-    
-    def _draw_edge(self, surface: pygame.Surface, x1: float, y1: float, 
-                  x2: float, y2: float, is_highlighted: bool = False):
-        """Draw a line between two points"""
-        color = self.highlight_color if is_highlighted else self.edge_style.color
-        width = self.highlight_width if is_highlighted else self.edge_style.width
-        
-        pygame.draw.line(
-            surface,
-            color,
-            (int(x1), int(y1)),
-            (int(x2), int(y2)),
-            width
-        )
-    
-    def _draw_arrow(self, surface: pygame.Surface, x1: float, y1: float, 
-                   x2: float, y2: float, x3: float, y3: float, 
-                   is_highlighted: bool = False):
-        """Draw an arrow (triangle) at the end of an edge"""
-        color = self.highlight_color if is_highlighted else self.edge_style.color
-        
-        pygame.draw.polygon(
-            surface,
-            color,
-            [
-                (int(x1), int(y1)),
-                (int(x2), int(y2)),
-                (int(x3), int(y3))
-            ]
-        )
+            # Draw the edge line
+            if len(points) >= 2:
+                draw_line(
+                    surface, color,
+                    (int(points[0][0] + offset_x), int(points[0][1] + offset_y)),
+                    (int(points[1][0] + offset_x), int(points[1][1] + offset_y)),
+                    width
+                )
+            
+            # Draw the arrow for directed edges
+            if directed and len(points) >= 4:
+                draw_polygon(surface, color, [
+                    (int(points[1][0] + offset_x), int(points[1][1] + offset_y)),
+                    (int(points[2][0] + offset_x), int(points[2][1] + offset_y)),
+                    (int(points[3][0] + offset_x), int(points[3][1] + offset_y))
+                ])
     
-    def _update_animation(self):
+    def _update_animation(self, current_time: Optional[int] = None):
         """Update the animation state"""
-        current_time = pygame.time.get_ticks()
-        
-        # Update node positions with easing
-        for node_id, (x, y) in list(self._animation_state.node_pos.items()):
-            target_x, target_y = self._get_node_position(node_id)
-            
-            # Skip if already at target
-            if abs(x - target_x) < 0.1 and abs(y - target_y) < 0.1:
-                self._animation_state.node_pos[node_id] = (target_x, target_y)
-                continue
-            
-            # Apply easing
-            new_x = x + (target_x - x) * ANIMATION_SPEED
-            new_y = y + (target_y - y) * ANIMATION_SPEED
-            
-            # Update position
-            self._animation_state.node_pos[node_id] = (new_x, new_y)
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        
+        # Ease only the rows still moving, snapping those within 0.1px of their target
+        state = self._animation_state
+        if state.moving_rows:
+            rows = np.fromiter(state.moving_rows, dtype=np.intp, count=len(state.moving_rows))
+            kernel = _ease_kernel()
+            if kernel is not None:
+                moving = kernel(state.node_pos, state.node_target, rows, ANIMATION_SPEED, 0.1,
+                                np.empty(len(rows), dtype=np.bool_))
+            else:
+                delta = state.node_target[rows] - state.node_pos[rows]
+                moving = (np.abs(delta) >= 0.1).any(axis=1)
+                state.node_pos[rows] += delta * np.where(moving, ANIMATION_SPEED, 1.0)[:, None]
+            state.moving_rows.difference_update(rows[~moving].tolist())
+            self._node_grid = None
+            # Rows moved, possibly for the last time, so the cached frame is stale
+            self._needs_redraw = True
         
         # Update edge positions
         self._update_edge_positions()
         
-        # Check if any highlights have expired
-        current_time = pygame.time.get_ticks()
-        
-        expired_nodes = [
-            node_id for node_id, end_time in self._animation_state.highlight_nodes.items()
-            if end_time <= current_time
-        ]
-        
-        expired_edges = [
-            edge for edge, end_time in self._animation_state.highlight_edges.items()
-            if end_time <= current_time
-        ]
-        
-        for node_id in expired_nodes:
-            del self._animation_state.highlight_nodes[node_id]
-        
-        for edge in expired_edges:
-            del self._animation_state.highlight_edges[edge]
-        
-        # Check if we're still animating
-        self._check_animation_state()
+        # Check if we're still animating (this also drops expired highlights)
+        self._check_animation_state(current_time)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse and keyboard events"""
@@ -754,6 +929,7 @@ class DataStructureView(UIComponent):
                 if hovered_node is not None:
                     self._selected_node = hovered_node
                     self._dragging = True
+                    self._needs_redraw = True
                     
                     # Calculate offset from node center
                     node_x, node_y = self._get_node_position(hovered_node)
@@ -777,9 +953,14 @@ class DataStructureView(UIComponent):
                 new_x = mouse_x + self._drag_offset[0]
                 new_y = mouse_y + self._drag_offset[1]
                 
-                # Keep node within bounds
-                new_x = max(self.node_style.radius, min(self.width - self.node_style.radius, new_x))
-                new_y = max(self.node_style.radius, min(self.height - self.node_style.radius, new_y))
+                # Keep node within bounds (upper bound first, so the lower one wins in a tiny view)
+                radius = self.node_style.radius
+                max_x = self.width - radius
+                max_y = self.height - radius
+                new_x = max_x if new_x > max_x else new_x
+                new_x = radius if new_x < radius else new_x
+                new_y = max_y if new_y > max_y else new_y
+                new_y = radius if new_y < radius else new_y
                 
                 self._set_node_position(self._selected_node, new_x, new_y, immediate=True)
                 self._update_edge_positions()
@@ -788,24 +969,52 @@ class DataStructureView(UIComponent):
         
         return False
     
+    def _get_node_grid(self) -> Dict[Tuple[int, int], List[Tuple[int, Any, float, float]]]:
+        """Nodes bucketed into square cells of one node diameter, keyed by cell"""
+        nodes = self._get_nodes()
+        cell = max(1, 2 * self.node_style.radius)
+        key = (self._topology_version, cell)
+        if self._node_grid is None or self._node_grid_key != key:
+            grid: Dict[Tuple[int, int], List[Tuple[int, Any, float, float]]] = {}
+            get_id = self._get_node_id
+            get_pos = self._get_node_position
+            for order, node in enumerate(nodes):
+                node_id = get_id(node)
+                node_x, node_y = get_pos(node_id)
+                grid.setdefault((int(node_x // cell), int(node_y // cell)), []).append(
+                    (order, node_id, node_x, node_y)
+                )
+            self._node_grid = grid
+            self._node_grid_key = key
+        return self._node_grid
+    
     def _get_node_at(self, x: float, y: float) -> Optional[Any]:
         """Get the node at the specified coordinates, or None if none found"""
-        nodes = self._get_nodes()
-        
-        for node in nodes:
-            node_id = self._get_node_id(node)
-            node_x, node_y = self._get_node_position(node_id)
-            
-            # Calculate distance from mouse to node center
-            dx = x - node_x
-            dy = y - node_y
-            distance_sq = dx * dx + dy * dy
-            
-            # Check if mouse is within node radius
-            if distance_sq <= self.node_style.radius * self.node_style.radius:
-                return node_id
-        
-        return None
+        grid = self._get_node_grid()
+        cell = self._node_grid_key[1]
+        cell_x = int(x // cell)
+        cell_y = int(y // cell)
+        radius = self.node_style.radius
+        radius_sq = radius * radius
+        bucket = grid.get
+        
+        # A node containing the point has its centre in this cell or a neighbour;
+        # among overlapping nodes the earliest in node order wins, as in a full scan
+        hit = None
+        for gx in (cell_x - 1, cell_x, cell_x + 1):
+            for gy in (cell_y - 1, cell_y, cell_y + 1):
+                for order, node_id, node_x, node_y in bucket((gx, gy), ()):
+                    if hit is not None and order > hit[0]:
+                        continue
+                    dx = x - node_x
+                    dy = y - node_y
+                    # Reject on the bounding box before the circle test
+                    if dx > radius or dx < -radius or dy > radius or dy < -radius:
+                        continue
+                    if dx * dx + dy * dy <= radius_sq:
+                        hit = (order, node_id)
+        
+        return hit[1] if hit is not None else None
     
     def update(self, dt: float):
         """Update the component state"""
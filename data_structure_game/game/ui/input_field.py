@@ -1,12 +1,68 @@
 import pygame
-from typing import Optional, Callable, List, Tuple, Dict, Any
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Optional, Callable, List, Tuple, Dict, Any, Iterable
 import string
 from .component import UIComponent, UIEvent, UIEventType
-from .text import Text
+from .text import Text, FontManager
+
+@lru_cache(maxsize=256)
+def _render_text(text: str, font_name: str, font_size: int,
+                 color: Tuple[int, ...]) -> pygame.Surface:
+    """Render a string once and reuse the surface until it falls out of the cache"""
+    return FontManager.get_font(font_name, font_size).render(text, True, color)
+
+# Event types whose handling depends on the pointer position
+_MOUSE_EVENT_TYPES = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
+# Word separators for Ctrl+arrow navigation and for double-click selection
+_NAV_BREAKS = ' \t'
+_WORD_BREAKS = ' \t\n'
+
+# A word followed by its trailing separators, and the rest of a word
+_NEXT_WORD = re.compile('[^%s]*[%s]*' % (_NAV_BREAKS, _NAV_BREAKS))
+_WORD_TAIL = re.compile('[^%s]*' % _WORD_BREAKS)
+
+def _prev_word_start(text: str, pos: int) -> int:
+    """Start of the word before pos, skipping any separators just before it"""
+    head = text[:pos].rstrip(_NAV_BREAKS)
+    return max(head.rfind(c) for c in _NAV_BREAKS) + 1
+
+def _next_word_start(text: str, pos: int) -> int:
+    """Start of the word after the one at pos"""
+    return _NEXT_WORD.match(text, pos).end()
+
+def _word_bounds(text: str, pos: int) -> Tuple[int, int]:
+    """Start and end of the word containing pos"""
+    start = max(text.rfind(c, 0, pos) for c in _WORD_BREAKS) + 1
+    return start, _WORD_TAIL.match(text, pos).end()
+
+# Characters outside digits, decimal point and minus sign, for numeric-only fields
+_NUMERIC_REJECT = re.compile('[^%s]' % re.escape(string.digits + '.-'))
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the longest common prefix of a and b"""
+    # Binary search on slice equality keeps the character comparisons in C
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def _reject_pattern(allowed: Iterable[str]) -> re.Pattern:
+    """Pattern matching every character not in allowed"""
+    chars = ''.join(allowed)
+    return re.compile('[^%s]' % re.escape(chars)) if chars else re.compile('.', re.DOTALL)
 
 class InputField(UIComponent):
     """A text input field component"""
     
+    HANDLED_EVENT_TYPES = UIComponent.HANDLED_EVENT_TYPES | {pygame.KEYDOWN, pygame.TEXTINPUT}
+    
     def __init__(self, x: int, y: int, width: int, height: int = 30,
                  text: str = "", placeholder: str = "", parent: Optional[UIComponent] = None):
         super().__init__(x, y, width, height, parent)
@@ -25,11 +81,25 @@ class InputField(UIComponent):
         self.cursor_pos = len(text)
         self.selection_start = None
         self.cursor_visible = True
-        self.cursor_timer = 0
+        self.cursor_timer = 0  # ms since the cursor last blinked
         self.cursor_blink_interval = 500  # ms
+        self._last_click_pos = self.cursor_pos
+        self._last_click_time = None
         
         # Text metrics
+        self._font = None
+        self._font_key = None
         self._text_surface = None
+        self._composite_surface = None
+        self._composite_key = None
+        self._placeholder_surface = None
+        self._placeholder_key = None
+        self._text_dirty = True
+        self._layout_dirty = True
+        self._rendered_focus = None
+        self._char_widths = [0]  # _char_widths[i] is the pixel width of _measured_text[:i]
+        self._measured_text = ""
+        self._measured_font = None
         self._text_rect = None
         self._text_offset = 0
         self._text_width = 0
@@ -37,6 +107,8 @@ class InputField(UIComponent):
         
         # Input constraints
         self.max_length = 0  # 0 means no limit
+        self._allowed_chars = None
+        self._allowed_reject = None
         self.allowed_chars = None  # None means all characters are allowed
         self.numeric_only = False
         self.multiline = False
@@ -77,6 +149,17 @@ class InputField(UIComponent):
             self.selection_start = None
             self._update_text_surface()
     
+    @property
+    def allowed_chars(self) -> Optional[Iterable[str]]:
+        """Get the characters accepted by the field, or None for any"""
+        return self._allowed_chars
+    
+    @allowed_chars.setter
+    def allowed_chars(self, value: Optional[Iterable[str]]):
+        """Set the accepted characters and compile the filter for them"""
+        self._allowed_chars = value
+        self._allowed_reject = _reject_pattern(value) if value is not None else None
+    
     def get_selected_text(self) -> str:
         """Get the currently selected text"""
         if self.selection_start is None:
@@ -113,62 +196,108 @@ class InputField(UIComponent):
             return
         
         # Filter characters if needed
-        if self.allowed_chars is not None:
-            text = ''.join(c for c in text if c in self.allowed_chars)
+        if self._allowed_reject is not None:
+            text = self._allowed_reject.sub('', text)
         
         if self.numeric_only:
             # Only allow digits, decimal point, and minus sign
-            allowed = set(string.digits + '.-')
-            text = ''.join(c for c in text if c in allowed)
+            text = _NUMERIC_REJECT.sub('', text)
         
         # Insert the text
         self._text = self._text[:self.cursor_pos] + text + self._text[self.cursor_pos:]
         self.cursor_pos += len(text)
         self._update_text_surface()
     
+    def _get_font(self) -> pygame.font.Font:
+        """Get the font for the current font name and size, loading it only when they change"""
+        key = (self.font_name, self.font_size)
+        if self._font is None or self._font_key != key:
+            self._font = FontManager.get_font(*key)
+            self._font_key = key
+        return self._font
+    
     def _update_text_surface(self):
-        """Update the rendered text surface"""
+        """Re-render the text and reposition the cursor before the next draw"""
+        self._invalidate_text_surface()
+        self._invalidate_layout()
+    
+    def _invalidate_layout(self):
+        """Reposition the cursor and text offset before the next draw"""
+        self._layout_dirty = True
+    
+    def _ensure_layout(self):
+        """Apply any pending text and cursor updates, once however many events queued them"""
+        if self._layout_dirty:
+            self._layout_dirty = False
+            self._update_cursor_position()
+    
+    def _invalidate_text_surface(self):
+        """Mark the rendered text surface as out of date"""
+        self._text_dirty = True
+    
+    def _get_placeholder_surface(self) -> pygame.Surface:
+        """Get the rendered placeholder, rendering it only when its text or style changes"""
+        key = (self.placeholder, self.font_name, self.font_size, self.placeholder_color)
+        if self._placeholder_surface is None or self._placeholder_key != key:
+            self._placeholder_surface = _render_text(*key)
+            self._placeholder_key = key
+        return self._placeholder_surface
+    
+    def _ensure_text_surface(self):
+        """Render the text surface if the text or focus changed since it was last rendered"""
         if not hasattr(self, 'font_name') or not hasattr(self, 'font_size'):
             return
         
+        # The placeholder is only shown while unfocused
+        if not self._text_dirty and self._rendered_focus == self._focused:
+            return
+        
         # Get the font
-        font = pygame.font.SysFont(self.font_name, self.font_size)
-        
-        # Determine what text to display
-        display_text = self._text
-        if not display_text and not self._focused and self.placeholder:
-            display_text = self.placeholder
-        
-        # Render the text
-        if display_text:
-            self._text_surface = font.render(display_text, True, 
-                                           self.placeholder_color if not self._text and not self._focused and self.placeholder 
-                                           else self.text_color)
+        font = self._get_font()
+        
+        # Render the text, or the placeholder while empty and unfocused
+        if not self._text and not self._focused and self.placeholder:
+            self._text_surface = self._get_placeholder_surface()
+        elif self._text:
+            self._text_surface = _render_text(self._text, self.font_name, self.font_size, self.text_color)
+        else:
+            self._text_surface = None
+        
+        if self._text_surface:
             self._text_rect = self._text_surface.get_rect()
             self._text_width, self._text_height = self._text_surface.get_size()
         else:
-            # Create an empty surface with the correct height
-            self._text_surface = None
+            # No surface, but keep the line height for the cursor
             self._text_rect = pygame.Rect(0, 0, 0, font.get_height())
             self._text_width = 0
             self._text_height = font.get_height()
         
-        # Update cursor and text position
-        self._update_cursor_position()
+        # Prefix widths only depend on the text, not on what is displayed. Prefixes
+        # ending before the first changed character are unchanged strings, so only
+        # the widths from the edit onwards are measured again.
+        if self._text_dirty:
+            text = self._text
+            if font is self._measured_font:
+                keep = _common_prefix_length(self._measured_text, text) + 1
+            else:
+                keep = 1
+            self._char_widths[keep:] = [font.size(text[:i])[0] for i in range(keep, len(text) + 1)]
+            self._measured_text = text
+            self._measured_font = font
+        
+        self._text_dirty = False
+        self._rendered_focus = self._focused
     
     def _update_cursor_position(self):
         """Update the cursor position and text offset"""
         if not hasattr(self, 'font_name') or not hasattr(self, 'font_size'):
             return
         
-        font = pygame.font.SysFont(self.font_name, self.font_size)
+        # Measurements below rely on the current text width
+        self._ensure_text_surface()
         
         # Calculate the width of the text before the cursor
-        text_before_cursor = self._text[:self.cursor_pos]
-        if text_before_cursor:
-            text_width = font.size(text_before_cursor)[0]
-        else:
-            text_width = 0
+        text_width = self._char_widths[self.cursor_pos]
         
         # Get the available width for the text
         padding_left = self.styles['padding'][3]
@@ -194,6 +323,49 @@ class InputField(UIComponent):
     
     def _render_content(self, surface: pygame.Surface, abs_x: int, abs_y: int):
         """Render the input field content"""
+        self._ensure_layout()
+        
+        # Everything but the blinking cursor is drawn once into a cached surface
+        # and only redrawn when something it shows has changed
+        key = self._composite_state()
+        if self._composite_surface is None or self._composite_key != key:
+            if self._composite_surface is None or self._composite_surface.get_size() != (self.width, self.height):
+                self._composite_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._composite_surface.fill((0, 0, 0, 0))
+            self._draw_field(self._composite_surface)
+            self._composite_key = key
+        
+        surface.blit(self._composite_surface, (abs_x, abs_y))
+        
+        # Draw the cursor on top, clipped to the field's interior
+        if self._text_surface and self._focused and self.cursor_visible and not self.readonly:
+            border_width = self.styles.get('focused_border_width', self.styles['border_width'])
+            old_clip = surface.get_clip()
+            surface.set_clip(pygame.Rect(
+                abs_x + border_width,
+                abs_y + border_width,
+                self.width - border_width * 2,
+                self.height - border_width * 2
+            ).clip(old_clip))
+            text_y = abs_y + (self.height - self._text_height) // 2
+            self._draw_cursor(surface, abs_x, text_y, self.styles['padding'][3])
+            surface.set_clip(old_clip)
+    
+    def _composite_state(self) -> Tuple:
+        """Everything the cached field surface depends on"""
+        has_selection = (self._focused and self.selection_start is not None
+                         and self.selection_start != self.cursor_pos)
+        return (
+            self.width, self.height, self.enabled, self._pressed, self._hovered, self._focused,
+            dict(self.styles), self._text, self._text_surface, self._text_offset,
+            self._text_height, self.selection_color,
+            (self.selection_start, self.cursor_pos) if has_selection else None,
+        )
+    
+    def _draw_field(self, surface: pygame.Surface):
+        """Draw the background, border, text and selection at the surface origin"""
+        abs_x = abs_y = 0
+        
         # Draw the background
         bg_color = self.styles['background_color']
         border_color = self.styles['border_color']
@@ -263,10 +435,6 @@ class InputField(UIComponent):
             
             # Draw the text
             surface.blit(self._text_surface, (text_x, text_y))
-            
-            # Draw the cursor
-            if self._focused and self.cursor_visible and not self.readonly:
-                self._draw_cursor(surface, abs_x, text_y, padding_left)
         
         # Restore the clipping area
         surface.set_clip(old_clip)
@@ -276,13 +444,12 @@ class InputField(UIComponent):
         if not self._text:
             return
         
-        font = pygame.font.SysFont(self.font_name, self.font_size)
-        text_before_selection = self._text[:min(self.cursor_pos, self.selection_start)]
-        selected_text = self.get_selected_text()
+        start = min(self.cursor_pos, self.selection_start)
+        end = max(self.cursor_pos, self.selection_start)
         
-        # Calculate the position and size of the selection
-        x = abs_x + padding_left + font.size(text_before_selection)[0] - self._text_offset
-        width = font.size(selected_text)[0]
+        # Calculate the position and size of the selection from the prefix widths
+        x = abs_x + padding_left + self._char_widths[start] - self._text_offset
+        width = self._char_widths[end] - self._char_widths[start]
         
         # Draw the selection rectangle
         selection_rect = pygame.Rect(
@@ -295,8 +462,8 @@ class InputField(UIComponent):
         pygame.draw.rect(surface, self.selection_color, selection_rect)
         
         # Re-render the selected text with the appropriate colors
-        if selected_text:
-            selected_surface = font.render(selected_text, True, (0, 0, 0))
+        if end > start:
+            selected_surface = _render_text(self._text[start:end], self.font_name, self.font_size, (0, 0, 0))
             surface.blit(selected_surface, (x, text_y))
     
     def _draw_cursor(self, surface: pygame.Surface, abs_x: int, text_y: int, padding_left: int):
@@ -304,14 +471,8 @@ class InputField(UIComponent):
         if not hasattr(self, 'font_name') or not hasattr(self, 'font_size'):
             return
         
-        font = pygame.font.SysFont(self.font_name, self.font_size)
-        text_before_cursor = self._text[:self.cursor_pos]
-        
         # Calculate the cursor position
-        if text_before_cursor:
-            cursor_x = abs_x + padding_left + font.size(text_before_cursor)[0] - self._text_offset
-        else:
-            cursor_x = abs_x + padding_left - self._text_offset
+        cursor_x = abs_x + padding_left + self._char_widths[self.cursor_pos] - self._text_offset
         
         # Draw the cursor
         cursor_rect = pygame.Rect(
@@ -328,24 +489,23 @@ class InputField(UIComponent):
         if not self.visible or not self.enabled:
             return False
         
-        # Check if the mouse is over the input field
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_over = self.point_in_component(mouse_pos)
+        if event.type not in self.HANDLED_EVENT_TYPES:
+            return False
+        
+        # Check if the mouse is over the input field; keyboard events never need it,
+        # and a selection drag leaves the hover state alone
+        dragging = event.type == pygame.MOUSEMOTION and self._pressed and self._focused
+        if event.type in _MOUSE_EVENT_TYPES:
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_over = not dragging and self.point_in_component(mouse_pos)
+        else:
+            mouse_pos = None
+            mouse_over = False
         
         # Handle mouse events
         if event.type == pygame.MOUSEMOTION:
-            # Update hover state
-            was_hovered = self._hovered
-            self._hovered = mouse_over
-            
-            # Change cursor to I-beam when over the input field
-            if self._hovered and not was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_IBEAM)
-            elif not self._hovered and was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-            
             # Handle text selection with mouse drag
-            if self._pressed and self._focused:
+            if dragging:
                 # Calculate the cursor position based on the mouse position
                 self._update_cursor_from_mouse(mouse_pos[0])
                 
@@ -354,6 +514,16 @@ class InputField(UIComponent):
                     self.selection_start = self._last_click_pos
                 
                 return True
+            
+            # Update hover state
+            was_hovered = self._hovered
+            self._hovered = mouse_over
+            
+            # Change cursor to I-beam when over the input field
+            if self._hovered and not was_hovered:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_IBEAM)
+            elif not self._hovered and was_hovered:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
@@ -363,34 +533,29 @@ class InputField(UIComponent):
                 if not self._focused:
                     self._focused = True
                     self.cursor_visible = True
-                    self.cursor_timer = pygame.time.get_ticks()
-                    self.dispatch_event(UIEvent(UIEventType.FOCUS, self))
+                    self.cursor_timer = 0
+                    self.dispatch_event(self._ui_event(UIEventType.FOCUS))
                 
                 # Update cursor position
                 self._update_cursor_from_mouse(mouse_pos[0])
                 
                 # Reset selection
+                current_time = pygame.time.get_ticks()
+                prev_click_time = self._last_click_time
                 self.selection_start = None
                 self._last_click_pos = self.cursor_pos
-                self._last_click_time = pygame.time.get_ticks()
+                self._last_click_time = current_time
                 
                 # Handle double-click to select word
-                current_time = pygame.time.get_ticks()
-                if hasattr(self, '_last_click_time') and current_time - self._last_click_time < 300:  # 300ms double-click threshold
+                if prev_click_time is not None and current_time - prev_click_time < 300:  # 300ms double-click threshold
                     # Select the word under the cursor
                     if self._text:
                         # Find word boundaries
-                        start = self.cursor_pos
-                        while start > 0 and self._text[start-1] not in (' ', '\t', '\n'):
-                            start -= 1
-                        
-                        end = self.cursor_pos
-                        while end < len(self._text) and self._text[end] not in (' ', '\t', '\n'):
-                            end += 1
+                        start, end = _word_bounds(self._text, self.cursor_pos)
                         
                         self.cursor_pos = end
                         self.selection_start = start
-                        self._update_text_surface()
+                        self._invalidate_layout()
                 
                 return True
         
@@ -404,7 +569,7 @@ class InputField(UIComponent):
             if event.type == pygame.KEYDOWN:
                 # Reset cursor blink timer
                 self.cursor_visible = True
-                self.cursor_timer = pygame.time.get_ticks()
+                self.cursor_timer = 0
                 
                 # Handle special keys
                 if event.key == pygame.K_BACKSPACE:
@@ -427,10 +592,7 @@ class InputField(UIComponent):
                 elif event.key == pygame.K_LEFT:
                     if event.mod & pygame.KMOD_CTRL:
                         # Move to previous word
-                        while self.cursor_pos > 0 and self._text[self.cursor_pos-1] in (' ', '\t'):
-                            self.cursor_pos -= 1
-                        while self.cursor_pos > 0 and self._text[self.cursor_pos-1] not in (' ', '\t'):
-                            self.cursor_pos -= 1
+                        self.cursor_pos = _prev_word_start(self._text, self.cursor_pos)
                     else:
                         # Move left one character
                         if self.cursor_pos > 0:
@@ -442,16 +604,13 @@ class InputField(UIComponent):
                     elif self.selection_start is None:
                         self.selection_start = self.cursor_pos + 1
                     
-                    self._update_text_surface()
+                    self._invalidate_layout()
                     return True
                 
                 elif event.key == pygame.K_RIGHT:
                     if event.mod & pygame.KMOD_CTRL:
                         # Move to next word
-                        while self.cursor_pos < len(self._text) and self._text[self.cursor_pos] not in (' ', '\t'):
-                            self.cursor_pos += 1
-                        while self.cursor_pos < len(self._text) and self._text[self.cursor_pos] in (' ', '\t'):
-                            self.cursor_pos += 1
+                        self.cursor_pos = _next_word_start(self._text, self.cursor_pos)
                     else:
                         # Move right one character
                         if self.cursor_pos < len(self._text):
@@ -463,7 +622,7 @@ class InputField(UIComponent):
                     elif self.selection_start is None:
                         self.selection_start = self.cursor_pos - 1
                     
-                    self._update_text_surface()
+                    self._invalidate_layout()
                     return True
                 
                 elif event.key == pygame.K_HOME:
@@ -476,7 +635,7 @@ class InputField(UIComponent):
                     elif self.selection_start is None:
                         self.selection_start = self.cursor_pos
                     
-                    self._update_text_surface()
+                    self._invalidate_layout()
                     return True
                 
                 elif event.key == pygame.K_END:
@@ -489,7 +648,7 @@ class InputField(UIComponent):
                     elif self.selection_start is None:
                         self.selection_start = self.cursor_pos
                     
-                    self._update_text_surface()
+                    self._invalidate_layout()
                     return True
                 
                 elif event.key == pygame.K_RETURN and self.multiline:
@@ -533,14 +692,14 @@ class InputField(UIComponent):
                     if self._text:
                         self.selection_start = 0
                         self.cursor_pos = len(self._text)
-                        self._update_text_surface()
+                        self._invalidate_layout()
                     return True
                 
                 elif event.key == pygame.K_ESCAPE:
                     # Deselect text
                     if self.selection_start is not None:
                         self.selection_start = None
-                        self._update_text_surface()
+                        self._invalidate_layout()
                         return True
             
             elif event.type == pygame.TEXTINPUT:
@@ -554,7 +713,7 @@ class InputField(UIComponent):
             self._focused = False
             self.cursor_visible = False
             self.selection_start = None
-            self.dispatch_event(UIEvent(UIEventType.BLUR, self))
+            self.dispatch_event(self._ui_event(UIEventType.BLUR))
             return False
         
         return False
@@ -564,43 +723,31 @@ class InputField(UIComponent):
         if not hasattr(self, 'font_name') or not hasattr(self, 'font_size'):
             return
         
-        font = pygame.font.SysFont(self.font_name, self.font_size)
         padding_left = self.styles['padding'][3]
         
+        # Measure against the current text and scroll offset
+        self._ensure_layout()
+        
         # Adjust mouse X to account for text offset and padding
         text_x = mouse_x - self.get_absolute_position()[0] - padding_left + self._text_offset
         
         # Find the cursor position that corresponds to this X coordinate
+        char_widths = self._char_widths
         if not self._text:
             self.cursor_pos = 0
         else:
-            # Binary search to find the cursor position
-            low = 0
-            high = len(self._text)
-            
-            while low < high:
-                mid = (low + high) // 2
-                mid_text = self._text[:mid]
-                mid_width = font.size(mid_text)[0]
-                
-                if mid_width < text_x:
-                    low = mid + 1
-                else:
-                    high = mid
-            
-            # After the loop, low is the position where the cursor should be
-            self.cursor_pos = low
+            # First position whose prefix reaches the mouse X, or the end of the text
+            self.cursor_pos = bisect_left(char_widths, text_x, 0, len(self._text))
             
             # If we're closer to the previous character, use that position
             if self.cursor_pos > 0:
-                prev_text = self._text[:self.cursor_pos-1]
-                prev_width = font.size(prev_text)[0]
+                prev_width = char_widths[self.cursor_pos-1]
                 
-                if abs(prev_width - text_x) < abs(font.size(self._text[:self.cursor_pos])[0] - text_x):
+                if abs(prev_width - text_x) < abs(char_widths[self.cursor_pos] - text_x):
                     self.cursor_pos -= 1
         
         # Update the display
-        self._update_text_surface()
+        self._invalidate_layout()
     
     def update(self, dt: float):
         """Update the input field state"""
@@ -609,10 +756,10 @@ class InputField(UIComponent):
         
         # Update cursor blink
         if self._focused and not self.readonly:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.cursor_timer > self.cursor_blink_interval:
+            self.cursor_timer += dt * 1000
+            if self.cursor_timer > self.cursor_blink_interval:
                 self.cursor_visible = not self.cursor_visible
-                self.cursor_timer = current_time
+                self.cursor_timer %= self.cursor_blink_interval
     
     def set_focus(self, focused: bool):
         """Set the focus state of the input field"""
@@ -621,14 +768,14 @@ class InputField(UIComponent):
             self.cursor_visible = focused
             
             if focused:
-                self.cursor_timer = pygame.time.get_ticks()
-                self.dispatch_event(UIEvent(UIEventType.FOCUS, self))
+                self.cursor_timer = 0
+                self.dispatch_event(self._ui_event(UIEventType.FOCUS))
                 
                 # If this component is getting focus, notify parent to manage focus
                 if self.parent:
                     self.parent._child_got_focus(self)
             else:
-                self.dispatch_event(UIEvent(UIEventType.BLUR, self))
+                self.dispatch_event(self._ui_event(UIEventType.BLUR))
     
     def set_text(self, text: str):
         """Set the text content"""
@@ -651,6 +798,9 @@ class InputField(UIComponent):
         
         super().set_style(**styles)
         
+        if 'font_name' in styles or 'font_size' in styles:
+            self._font = None
+        
         if needs_text_update:
             self._update_text_surface()
     
@@ -664,4 +814,4 @@ class InputField(UIComponent):
                 self.cursor_visible = False
             elif self._focused:
                 self.cursor_visible = True
-                self.cursor_timer = pygame.time.get_ticks()
+                self.cursor_timer = 0
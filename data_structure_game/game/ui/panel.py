@@ -2,9 +2,48 @@ import pygame
 from typing import Optional, List, Tuple, Dict, Any, Callable
 from .component import UIComponent, UIEvent, UIEventType
 
+# Events whose handling depends on where the pointer is
+_POINTER_EVENT_TYPES = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL})
+
+# Style keys that affect the cached panel background
+_CHROME_STYLE_KEYS = ('shadow', 'shadow_color', 'shadow_offset', 'background_color',
+                      'border_color', 'border_width', 'border_radius', 'scrollable')
+
+def _compute_thumbs(width, height, content_w, content_h, scroll_x, scroll_y, bar_size, scrollable):
+    """Scroll bar visibility and both thumbs' (x, y, w, h), zeros for a hidden bar"""
+    vvis = scrollable and content_h > height
+    vpx = bar_size * vvis
+    hvis = scrollable and content_w > width - vpx
+    avail_w = width - vpx
+    
+    vx = vy = vw = vh = 0
+    if vvis:
+        vh = max(30, height * height // content_h)
+        vy = int(scroll_y * (height - vh) / (content_h - height))
+        vx = width - bar_size
+        vw = bar_size
+    
+    hx = hy = hw = hh = 0
+    if hvis:
+        hw = max(30, avail_w * avail_w // content_w)
+        hx = int(scroll_x * (avail_w - hw) / (content_w - avail_w))
+        hy = height - bar_size
+        hh = bar_size
+    return vvis, hvis, vx, vy, vw, vh, hx, hy, hw, hh
+
+def _drag_scroll(delta, viewport, content, thumb, bar_px):
+    """Scroll offset for a thumb dragged delta pixels, and whether the thumb can move"""
+    thumb_range = viewport - thumb - bar_px
+    if thumb_range <= 0:
+        return False, 0
+    return True, int((delta / thumb_range) * (content - viewport + bar_px))
+
 class Panel(UIComponent):
     """A container component that can hold other components and has a background"""
     
+    HANDLED_EVENT_TYPES = UIComponent.HANDLED_EVENT_TYPES | {pygame.MOUSEWHEEL}
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  parent: Optional[UIComponent] = None):
         super().__init__(x, y, width, height, parent)
@@ -25,6 +64,10 @@ class Panel(UIComponent):
             'clip_children': True
         })
         
+        # Cached shadow, background, border and scroll tracks
+        self._chrome_surface: Optional[pygame.Surface] = None
+        self._chrome_key: Optional[Tuple] = None
+        
         # Create a surface for the panel content
         self._content_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         self._content_rect = pygame.Rect(0, 0, width, height)
@@ -40,6 +83,12 @@ class Panel(UIComponent):
         self._scrollbar_pressed = False
         self._scrollbar_drag_start = None
         
+        # Blits drawn into the content surface, kept while they are all unchanged
+        self._children_key: Optional[List[Tuple[pygame.Surface, Tuple[int, int]]]] = None
+        
+        # Events passed to children with panel-relative coordinates, one per type
+        self._child_events: Dict[int, pygame.event.Event] = {}
+        
         # Content size (for scrolling)
         self._content_width = width
         self._content_height = height
@@ -51,72 +100,37 @@ class Panel(UIComponent):
     
     def _update_scroll_bars(self):
         """Update the scroll bars based on content size and viewport"""
-        # Check if vertical scroll bar is needed
-        self._vscroll_visible = (
-            self.styles['scrollable'] and 
-            self._content_height > self.height
-        )
-        
-        # Check if horizontal scroll bar is needed
-        self._hscroll_visible = (
-            self.styles['scrollable'] and 
-            self._content_width > self.width - (self._scrollbar_size if self._vscroll_visible else 0)
+        size = self._scrollbar_size
+        (self._vscroll_visible, self._hscroll_visible,
+         vx, vy, vw, vh, hx, hy, hw, hh) = _compute_thumbs(
+            self.width, self.height, self._content_width, self._content_height,
+            self.styles['scroll_x'], self.styles['scroll_y'], size,
+            bool(self.styles['scrollable'])
         )
         
         # Update content rectangle
-        content_width = self.width
-        content_height = self.height
-        
-        if self._vscroll_visible:
-            content_width -= self._scrollbar_size
-        if self._hscroll_visible:
-            content_height -= self._scrollbar_size
+        avail_w = self.width - size * self._vscroll_visible
+        avail_h = self.height - size * self._hscroll_visible
         
         # Update content surface size if needed
-        if (self._content_surface.get_width() != content_width or 
-            self._content_surface.get_height() != content_height):
-            self._content_surface = pygame.Surface((content_width, content_height), pygame.SRCALPHA)
+        if (self._content_surface.get_width() != avail_w or 
+            self._content_surface.get_height() != avail_h):
+            self._content_surface = pygame.Surface((avail_w, avail_h), pygame.SRCALPHA)
+            self._children_key = None
         
-        self._content_rect.size = (content_width, content_height)
+        self._content_rect.size = (avail_w, avail_h)
         
-        # Update scroll thumb sizes and positions
+        # Hidden bars keep their last thumb
         if self._vscroll_visible:
-            # Calculate thumb height based on visible area ratio
-            visible_ratio = self.height / self._content_height
-            thumb_height = max(30, int(self.height * visible_ratio))
-            
-            # Calculate thumb position based on scroll position
-            scroll_range = self._content_height - self.height
-            thumb_y = int((self.styles['scroll_y'] / scroll_range) * (self.height - thumb_height))
-            
-            self._vscroll_thumb = pygame.Rect(
-                self.width - self._scrollbar_size,
-                thumb_y,
-                self._scrollbar_size,
-                thumb_height
-            )
-        
+            self._vscroll_thumb = pygame.Rect(vx, vy, vw, vh)
         if self._hscroll_visible:
-            # Calculate thumb width based on visible area ratio
-            visible_ratio = (self.width - (self._scrollbar_size if self._vscroll_visible else 0)) / self._content_width
-            thumb_width = max(30, int((self.width - (self._scrollbar_size if self._vscroll_visible else 0)) * visible_ratio))
-            
-            # Calculate thumb position based on scroll position
-            scroll_range = self._content_width - self.width + (self._scrollbar_size if self._vscroll_visible else 0)
-            thumb_x = int((self.styles['scroll_x'] / scroll_range) * (self.width - thumb_width - (self._scrollbar_size if self._vscroll_visible else 0)))
-            
-            self._hscroll_thumb = pygame.Rect(
-                thumb_x,
-                self.height - self._scrollbar_size,
-                thumb_width,
-                self._scrollbar_size
-            )
+            self._hscroll_thumb = pygame.Rect(hx, hy, hw, hh)
     
     def set_content_size(self, width: int, height: int):
         """Set the size of the content area (for scrolling)"""
         if self._content_width != width or self._content_height != height:
-            self._content_width = max(width, self.width - (self._scrollbar_size if self._vscroll_visible else 0))
-            self._content_height = max(height, self.height - (self._scrollbar_size if self._hscroll_visible else 0))
+            self._content_width = max(width, self.width - self._scrollbar_size * self._vscroll_visible)
+            self._content_height = max(height, self.height - self._scrollbar_size * self._hscroll_visible)
             self._update_scroll_bars()
     
     def scroll_to(self, x: int = None, y: int = None):
@@ -125,11 +139,11 @@ class Panel(UIComponent):
         scroll_y = self.styles['scroll_y']
         
         if x is not None:
-            max_scroll_x = max(0, self._content_width - self.width + (self._scrollbar_size if self._vscroll_visible else 0))
+            max_scroll_x = max(0, self._content_width - self.width + self._scrollbar_size * self._vscroll_visible)
             scroll_x = max(0, min(x, max_scroll_x))
         
         if y is not None:
-            max_scroll_y = max(0, self._content_height - self.height + (self._scrollbar_size if self._hscroll_visible else 0))
+            max_scroll_y = max(0, self._content_height - self.height + self._scrollbar_size * self._hscroll_visible)
             scroll_y = max(0, min(y, max_scroll_y))
         
         if scroll_x != self.styles['scroll_x'] or scroll_y != self.styles['scroll_y']:
@@ -147,60 +161,35 @@ class Panel(UIComponent):
             self.styles['scroll_y'] + dy
         )
     
-    def _render_scroll_bars(self, surface: pygame.Surface):
-        """Render the scroll bars"""
+    def _render_scroll_tracks(self, surface: pygame.Surface):
+        """Render the scroll bar tracks and the corner between them"""
         if not self.styles['scrollable']:
             return
         
-        # Draw vertical scroll bar
+        # Vertical track
         if self._vscroll_visible:
-            # Track
             track_rect = pygame.Rect(
                 self.width - self._scrollbar_size,
                 0,
                 self._scrollbar_size,
-                self.height - (self._scrollbar_size if self._hscroll_visible else 0)
+                self.height - self._scrollbar_size * self._hscroll_visible
             )
             pygame.draw.rect(surface, (220, 220, 220), track_rect)
-            
-            # Thumb
-            thumb_color = self._scrollbar_active_color if self._scrollbar_pressed else \
-                         self._scrollbar_hover_color if self._scrollbar_hovered else \
-                         self._scrollbar_color
-            
-            pygame.draw.rect(surface, thumb_color, self._vscroll_thumb, border_radius=6)
-            pygame.draw.rect(
-                surface, 
-                (255, 255, 255, 100), 
-                self._vscroll_thumb.inflate(-4, -4), 
-                border_radius=4
-            )
         
-        # Draw horizontal scroll bar
+        # Horizontal track
         if self._hscroll_visible:
-            # Track
             track_rect = pygame.Rect(
                 0,
                 self.height - self._scrollbar_size,
-                self.width - (self._scrollbar_size if self._vscroll_visible else 0),
+                self.width - self._scrollbar_size * self._vscroll_visible,
                 self._scrollbar_size
             )
             pygame.draw.rect(surface, (220, 220, 220), track_rect)
-            
-            # Thumb
-            thumb_color = self._scrollbar_active_color if self._scrollbar_pressed else \
-                         self._scrollbar_hover_color if self._scrollbar_hovered else \
-                         self._scrollbar_color
-            
-            pygame.draw.rect(surface, thumb_color, self._hscroll_thumb, border_radius=6)
-            pygame.draw.rect(
-                surface, 
-                (255, 255, 255, 100), 
-                self._hscroll_thumb.inflate(-4, -4), 
-                border_radius=4
-            )
         
-        # Draw corner between scroll bars if both are visible
+        self._render_scroll_corner(surface)
+    
+    def _render_scroll_corner(self, surface: pygame.Surface):
+        """Draw the corner between the scroll bars if both are visible"""
         if self._vscroll_visible and self._hscroll_visible:
             corner_rect = pygame.Rect(
                 self.width - self._scrollbar_size,
@@ -210,14 +199,46 @@ class Panel(UIComponent):
             )
             pygame.draw.rect(surface, (220, 220, 220), corner_rect)
     
-    def _render_content(self, surface: pygame.Surface, abs_x: int, abs_y: int):
-        """Render the panel content"""
-        # Draw shadow if enabled
+    def _render_scroll_thumbs(self, surface: pygame.Surface):
+        """Render the scroll bar thumbs over their tracks"""
+        if not self.styles['scrollable']:
+            return
+        
+        thumb_color = self._scrollbar_active_color if self._scrollbar_pressed else \
+                     self._scrollbar_hover_color if self._scrollbar_hovered else \
+                     self._scrollbar_color
+        
+        for thumb, visible in ((self._vscroll_thumb, self._vscroll_visible),
+                               (self._hscroll_thumb, self._hscroll_visible)):
+            if visible:
+                pygame.draw.rect(surface, thumb_color, thumb, border_radius=6)
+                pygame.draw.rect(
+                    surface, 
+                    (255, 255, 255, 100), 
+                    thumb.inflate(-4, -4), 
+                    border_radius=4
+                )
+        
+        # The corner covers the end of a vertical thumb scrolled to the bottom
+        self._render_scroll_corner(surface)
+    
+    def _chrome_state(self) -> Tuple:
+        """Everything the cached background and scroll tracks depend on"""
+        return (
+            self.width, self.height, self._vscroll_visible, self._hscroll_visible,
+            self._scrollbar_size, tuple(self.styles[k] for k in _CHROME_STYLE_KEYS),
+        )
+    
+    def _rebuild_chrome(self):
+        """Draw the shadow, background, border and scroll tracks into the cached surface"""
+        if self._chrome_surface is None or self._chrome_surface.get_size() != (self.width, self.height):
+            self._chrome_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        chrome = self._chrome_surface
+        chrome.fill((0, 0, 0, 0))
+        
+        # Draw shadow if enabled; drawn straight onto the transparent surface so it
+        # keeps its own alpha and blends with whatever is behind the panel
         if self.styles['shadow'] and self.styles['background_color']:
-            shadow_surface = pygame.Surface(
-                (self.width, self.height), 
-                pygame.SRCALPHA
-            )
             shadow_color = self.styles['shadow_color']
             if isinstance(shadow_color, tuple) and len(shadow_color) == 3:
                 shadow_color = (*shadow_color, 100)  # Add alpha if not present
@@ -231,13 +252,11 @@ class Panel(UIComponent):
             )
             
             pygame.draw.rect(
-                shadow_surface, 
+                chrome, 
                 shadow_color, 
                 shadow_rect,
                 border_radius=self.styles['border_radius']
             )
-            
-            surface.blit(shadow_surface, (0, 0))
         
         # Draw the panel background
         bg_rect = pygame.Rect(0, 0, self.width, self.height)
@@ -249,7 +268,7 @@ class Panel(UIComponent):
         if bg_color:
             if border_radius > 0:
                 pygame.draw.rect(
-                    surface, 
+                    chrome, 
                     bg_color, 
                     bg_rect, 
                     border_radius=border_radius
@@ -257,25 +276,38 @@ class Panel(UIComponent):
                 
                 if border_width > 0 and border_color:
                     pygame.draw.rect(
-                        surface, 
+                        chrome, 
                         border_color, 
                         bg_rect, 
                         border_width, 
                         border_radius=border_radius
                     )
             else:
-                pygame.draw.rect(surface, bg_color, bg_rect)
+                pygame.draw.rect(chrome, bg_color, bg_rect)
                 
                 if border_width > 0 and border_color:
                     pygame.draw.rect(
-                        surface, 
+                        chrome, 
                         border_color, 
                         bg_rect, 
                         border_width
                     )
         
-        # Draw scroll bars if needed
-        self._render_scroll_bars(surface)
+        self._render_scroll_tracks(chrome)
+    
+    def _render_content(self, surface: pygame.Surface, abs_x: int, abs_y: int):
+        """Render the panel content"""
+        # The background, border and tracks only change with style, size or
+        # scroll bar visibility, so they are drawn once and blitted
+        key = self._chrome_state()
+        if self._chrome_surface is None or self._chrome_key != key:
+            self._rebuild_chrome()
+            self._chrome_key = key
+        
+        surface.blit(self._chrome_surface, (0, 0))
+        
+        # Draw the scroll thumbs, which move with the scroll position
+        self._render_scroll_thumbs(surface)
     
     def render(self, surface: pygame.Surface):
         """Render the panel and its children"""
@@ -286,51 +318,68 @@ class Panel(UIComponent):
         old_clip = surface.get_clip()
         
         # Set the panel's clip rect
-        panel_rect = pygame.Rect(
-            self.get_absolute_position()[0],
-            self.get_absolute_position()[1],
-            self.width,
-            self.height
-        )
+        abs_x, abs_y = self.get_absolute_position()
+        panel_rect = self._get_abs_rect()
         
         if self.styles['clip_children']:
             surface.set_clip(panel_rect)
         
         # Render the panel background and borders
-        self._render_content(surface, *self.get_absolute_position())
-        
-        # Set up the content surface for children
-        content_abs_x, content_abs_y = self.get_absolute_position()
+        self._render_content(surface, abs_x, abs_y)
         
-        # Apply padding
+        # Set up the content surface for children, applying padding and scroll
         padding_top, padding_right, padding_bottom, padding_left = self.styles['padding']
-        content_abs_x += padding_left - self.styles['scroll_x']
-        content_abs_y += padding_top - self.styles['scroll_y']
+        content_abs_x = abs_x + padding_left - self.styles['scroll_x']
+        content_abs_y = abs_y + padding_top - self.styles['scroll_y']
         
         # Save the current state
         old_surface = surface
         
         try:
-            # Create a temporary surface for the content
-            temp_surface = pygame.Surface(
-                (self._content_rect.width, self._content_rect.height), 
-                pygame.SRCALPHA
+            # Only render visible children that intersect with the visible area,
+            # culled against their cached rects in a single collidelistall call
+            children = [c for c in self._get_z_sorted_children() if c.visible]
+            visible_rect = pygame.Rect(
+                -content_abs_x,
+                -content_abs_y,
+                self.width,
+                self.height
             )
+            hits = [children[i] for i in visible_rect.collidelistall([c._get_abs_rect() for c in children])]
+            sources = [child._blit_source() for child in hits]
             
-            # Render children to the temporary surface
-            for child in sorted(self.children, key=lambda c: c.z_index):
-                # Only render visible children that intersect with the visible area
-                if child.visible:
-                    child_rect = child.get_absolute_rect()
-                    visible_rect = pygame.Rect(
-                        -content_abs_x,
-                        -content_abs_y,
-                        self.width,
-                        self.height
-                    )
-                    
-                    if child_rect.colliderect(visible_rect):
-                        child.render(temp_surface)
+            # When every child in view is a plain blit, the list of (surface, position)
+            # pairs fully describes the content, so an unchanged list reuses last
+            # frame's surface. Any other child may change without notice, so its
+            # presence always forces a redraw.
+            size = self._content_rect.size
+            temp_surface = self._content_surface
+            cacheable = None not in sources
+            if not cacheable or sources != self._children_key or temp_surface.get_size() != size:
+                # Draw into the persistent content surface, clearing it rather than
+                # allocating a new one every frame
+                if temp_surface.get_size() != size:
+                    temp_surface = self._content_surface = pygame.Surface(size, pygame.SRCALPHA)
+                else:
+                    temp_surface.fill((0, 0, 0, 0))
+                
+                # Render children to the temporary surface. Children that render as a
+                # single blit are collected and drawn in one fblits call, flushed before
+                # any other child so the z-order is kept.
+                batch = []
+                for child, source in zip(hits, sources):
+                    if source is not None:
+                        batch.append(source)
+                        continue
+                    if batch:
+                        temp_surface.fblits(batch)
+                        batch = []
+                    child.render(temp_surface)
+                
+                if batch:
+                    temp_surface.fblits(batch)
+                
+                self._children_key = sources if cacheable else None
             
             # Blit the content surface to the main surface
             surface.blit(
@@ -354,10 +403,23 @@ class Panel(UIComponent):
         if not self.visible or not self.enabled:
             return False
         
+        # Skip the tree walk for events nothing in this subtree reacts to
+        if not self._accepts_event_type(event.type):
+            return False
+        
         # Check if the event is within the panel's bounds
         mouse_pos = pygame.mouse.get_pos()
         in_bounds = self.point_in_component(mouse_pos)
         
+        # A pointer event outside the panel can only end a hover or a scroll bar drag
+        if not in_bounds and not self._scrollbar_pressed and event.type in _POINTER_EVENT_TYPES:
+            if self._scrollbar_hovered:
+                self._scrollbar_hovered = False
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            return False
+        
+        abs_x, abs_y = self.get_absolute_position()
+        
         # Handle scroll wheel events
         if in_bounds and event.type == pygame.MOUSEWHEEL:
             if self.styles['scrollable']:
@@ -373,11 +435,10 @@ class Panel(UIComponent):
             if self._vscroll_visible and self._scrollbar_drag_start is not None:
                 # Calculate new scroll position based on mouse movement
                 dy = mouse_pos[1] - self._scrollbar_drag_start[1]
-                scroll_range = self._content_height - self.height + (self._scrollbar_size if self._hscroll_visible else 0)
-                thumb_range = self.height - self._vscroll_thumb.height - (self._scrollbar_size if self._hscroll_visible else 0)
+                moved, scroll_y = _drag_scroll(dy, self.height, self._content_height, self._vscroll_thumb.height,
+                                               self._scrollbar_size * self._hscroll_visible)
                 
-                if thumb_range > 0:
-                    scroll_y = int((dy / thumb_range) * scroll_range)
+                if moved:
                     self.scroll_to(y=scroll_y)
                 
                 return True
@@ -385,11 +446,10 @@ class Panel(UIComponent):
             elif self._hscroll_visible and self._scrollbar_drag_start is not None:
                 # Calculate new scroll position based on mouse movement
                 dx = mouse_pos[0] - self._scrollbar_drag_start[0]
-                scroll_range = self._content_width - self.width + (self._scrollbar_size if self._vscroll_visible else 0)
-                thumb_range = self.width - self._hscroll_thumb.width - (self._scrollbar_size if self._vscroll_visible else 0)
+                moved, scroll_x = _drag_scroll(dx, self.width, self._content_width, self._hscroll_thumb.width,
+                                               self._scrollbar_size * self._vscroll_visible)
                 
-                if thumb_range > 0:
-                    scroll_x = int((dx / thumb_range) * scroll_range)
+                if moved:
                     self.scroll_to(x=scroll_x)
                 
                 return True
@@ -397,16 +457,16 @@ class Panel(UIComponent):
         # Handle scroll bar clicks
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._vscroll_visible and self._vscroll_thumb.collidepoint(
-                mouse_pos[0] - self.get_absolute_position()[0],
-                mouse_pos[1] - self.get_absolute_position()[1]
+                mouse_pos[0] - abs_x,
+                mouse_pos[1] - abs_y
             ):
                 self._scrollbar_pressed = True
                 self._scrollbar_drag_start = mouse_pos
                 return True
             
             elif self._hscroll_visible and self._hscroll_thumb.collidepoint(
-                mouse_pos[0] - self.get_absolute_position()[0],
-                mouse_pos[1] - self.get_absolute_position()[1]
+                mouse_pos[0] - abs_x,
+                mouse_pos[1] - abs_y
             ):
                 self._scrollbar_pressed = True
                 self._scrollbar_drag_start = mouse_pos
@@ -414,9 +474,9 @@ class Panel(UIComponent):
             
             # Click on track to page up/down
             elif self._vscroll_visible and (
-                mouse_pos[0] > self.get_absolute_position()[0] + self.width - self._scrollbar_size
+                mouse_pos[0] > abs_x + self.width - self._scrollbar_size
             ):
-                if mouse_pos[1] < self._vscroll_thumb.y + self.get_absolute_position()[1]:
+                if mouse_pos[1] < self._vscroll_thumb.y + abs_y:
                     # Page up
                     self.scroll_by(0, -self.height)
                 else:
@@ -425,9 +485,9 @@ class Panel(UIComponent):
                 return True
             
             elif self._hscroll_visible and (
-                mouse_pos[1] > self.get_absolute_position()[1] + self.height - self._scrollbar_size
+                mouse_pos[1] > abs_y + self.height - self._scrollbar_size
             ):
-                if mouse_pos[0] < self._hscroll_thumb.x + self.get_absolute_position()[0]:
+                if mouse_pos[0] < self._hscroll_thumb.x + abs_x:
                     # Page left
                     self.scroll_by(-self.width, 0)
                 else:
@@ -444,11 +504,11 @@ class Panel(UIComponent):
         # Update scroll bar hover state
         if event.type == pygame.MOUSEMOTION:
             if self._vscroll_visible and self._vscroll_thumb.collidepoint(
-                mouse_pos[0] - self.get_absolute_position()[0],
-                mouse_pos[1] - self.get_absolute_position()[1]
+                mouse_pos[0] - abs_x,
+                mouse_pos[1] - abs_y
             ) or (self._hscroll_visible and self._hscroll_thumb.collidepoint(
-                mouse_pos[0] - self.get_absolute_position()[0],
-                mouse_pos[1] - self.get_absolute_position()[1]
+                mouse_pos[0] - abs_x,
+                mouse_pos[1] - abs_y
             )):
                 if not self._scrollbar_hovered:
                     self._scrollbar_hovered = True
@@ -461,19 +521,19 @@ class Panel(UIComponent):
         # Let children handle the event
         if in_bounds:
             # Adjust mouse position for scrolling and padding
-            rel_x = mouse_pos[0] - self.get_absolute_position()[0] - self.styles['padding'][3] + self.styles['scroll_x']
-            rel_y = mouse_pos[1] - self.get_absolute_position()[1] - self.styles['padding'][0] + self.styles['scroll_y']
+            rel_x = mouse_pos[0] - abs_x - self.styles['padding'][3] + self.styles['scroll_x']
+            rel_y = mouse_pos[1] - abs_y - self.styles['padding'][0] + self.styles['scroll_y']
             
-            # Create a new event with adjusted coordinates
+            # Reuse one event per type with adjusted coordinates, refilled in place
             if hasattr(event, 'pos'):
-                new_event = pygame.event.Event(
-                    event.type,
-                    {
-                        **event.__dict__,
-                        'pos': (rel_x, rel_y),
-                        'rel': (event.rel if hasattr(event, 'rel') else (0, 0))
-                    }
-                )
+                new_event = self._child_events.get(event.type)
+                if new_event is None:
+                    new_event = self._child_events[event.type] = pygame.event.Event(event.type)
+                attrs = new_event.__dict__
+                attrs.clear()
+                attrs.update(event.__dict__)
+                attrs['pos'] = (rel_x, rel_y)
+                attrs['rel'] = event.rel if hasattr(event, 'rel') else (0, 0)
             else:
                 new_event = event
             
@@ -503,13 +563,14 @@ class Panel(UIComponent):
             self._update_scroll_bars()
             
             # Update content surface size
-            content_width = width - (self._scrollbar_size if self._vscroll_visible else 0)
-            content_height = height - (self._scrollbar_size if self._hscroll_visible else 0)
+            content_width = width - self._scrollbar_size * self._vscroll_visible
+            content_height = height - self._scrollbar_size * self._hscroll_visible
             
             if (content_width > 0 and content_height > 0 and 
                 (self._content_surface.get_width() != content_width or 
                  self._content_surface.get_height() != content_height)):
                 self._content_surface = pygame.Surface((content_width, content_height), pygame.SRCALPHA)
+                self._children_key = None
                 self._content_rect.size = (content_width, content_height)
     
     def add_child(self, child: 'UIComponent'):
@@ -518,9 +579,10 @@ class Panel(UIComponent):
         
         # Update content size if the child is outside the current bounds
         if self.styles['scrollable']:
-            child_rect = child.get_absolute_rect()
-            content_right = child_rect.right - self.get_absolute_position()[0] - self.styles['padding'][3]
-            content_bottom = child_rect.bottom - self.get_absolute_position()[1] - self.styles['padding'][0]
+            abs_x, abs_y = self.get_absolute_position()
+            child_rect = child._get_abs_rect()
+            content_right = child_rect.right - abs_x - self.styles['padding'][3]
+            content_bottom = child_rect.bottom - abs_y - self.styles['padding'][0]
             
             new_width = max(self._content_width, content_right + self.styles['padding'][1])
             new_height = max(self._content_height, content_bottom + self.styles['padding'][2])
@@ -533,12 +595,13 @@ class Panel(UIComponent):
         if super().remove_child(child):
             # Update content size if needed
             if self.styles['scrollable'] and self.children:
+                abs_x, abs_y = self.get_absolute_position()
                 max_right = max(
-                    c.get_absolute_rect().right - self.get_absolute_position()[0] - self.styles['padding'][3]
+                    c._get_abs_rect().right - abs_x - self.styles['padding'][3]
                     for c in self.children
                 )
                 max_bottom = max(
-                    c.get_absolute_rect().bottom - self.get_absolute_position()[1] - self.styles['padding'][0]
+                    c._get_abs_rect().bottom - abs_y - self.styles['padding'][0]
                     for c in self.children
                 )
                 
@@ -32,6 +32,9 @@ theme = get_theme()
 class GameScreen(Container):
     """Main game screen that handles the puzzle solving interface."""
     
+    # ESC is handled here, so keyboard events must be routed to this screen
+    HANDLED_EVENT_TYPES = Container.HANDLED_EVENT_TYPES | {pygame.KEYDOWN}
+    
     def __init__(self, rect: pygame.Rect, level: Level, on_back: Callable[[], None] = None):
         """Initialize the game screen with the current level.
         
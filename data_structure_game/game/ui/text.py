@@ -209,7 +209,11 @@ class Text(UIComponent):
         if not self._surface or not self.visible:
             return
         
-        # Calculate the position based on alignment
+        # Blit the text surface
+        surface.blit(self._surface, self._text_position(abs_x, abs_y))
+    
+    def _text_position(self, abs_x: int, abs_y: int) -> Tuple[int, int]:
+        """Top-left corner of the text surface for the current alignment"""
         x = abs_x
         y = abs_y
         
@@ -223,8 +227,14 @@ class Text(UIComponent):
         elif self._valign == 'bottom':
             y += self.height - self._surface.get_height()
         
-        # Blit the text surface
-        surface.blit(self._surface, (x, y))
+        return x, y
+    
+    def _blit_source(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """The text surface and its position, unless a background, clip or children need drawing"""
+        if (not self._surface or self.children or self.clip_rect
+                or self.styles.get('background_color')):
+            return None
+        return self._surface, self._text_position(*self.get_absolute_position())
     
     def get_text_size(self) -> Tuple[int, int]:
         """Get the size of the rendered text"""
@@ -0,0 +1,76 @@
+"""Numba-compiled layout and animation kernels for DataStructureView.
+
+Importing this module requires numba; the view falls back to its NumPy
+implementations when it is not installed.
+"""
+import numpy as np
+from numba import njit, prange
+
+@njit(cache=True, fastmath=True, parallel=True)
+def force_directed_layout(pos, edges, width, height, radius, iterations, tolerance):
+    """Force-directed layout over an (n, 2) position array, updated in place"""
+    n = pos.shape[0]
+    disp = np.empty_like(pos)
+    previous = np.empty_like(pos)
+    lower_x = radius
+    lower_y = radius
+    upper_x = width - radius
+    upper_y = height - radius
+    for _ in range(iterations):
+        previous[:, :] = pos
+
+        # Repulsive forces: each node sums its share over all others, so the
+        # rows are independent and the O(n^2) pass needs only O(n) memory.
+        for i in prange(n):
+            fx = 0.0
+            fy = 0.0
+            for j in range(n):
+                dx = pos[j, 0] - pos[i, 0]
+                dy = pos[j, 1] - pos[i, 1]
+                dist = max(0.1, np.sqrt(dx * dx + dy * dy))
+                scale = 1000.0 / (dist * dist * dist)
+                fx += dx * scale
+                fy += dy * scale
+            disp[i, 0] = fx
+            disp[i, 1] = fy
+        for i in range(n):
+            pos[i, 0] = max(lower_x, min(upper_x, pos[i, 0] - 0.5 * disp[i, 0]))
+            pos[i, 1] = max(lower_y, min(upper_y, pos[i, 1] - 0.5 * disp[i, 1]))
+
+        # Attractive forces (springs for edges), all measured before moving
+        disp[:, :] = 0.0
+        for k in range(edges.shape[0]):
+            a = edges[k, 0]
+            b = edges[k, 1]
+            sx = 0.01 * (pos[b, 0] - pos[a, 0])
+            sy = 0.01 * (pos[b, 1] - pos[a, 1])
+            disp[a, 0] += sx
+            disp[a, 1] += sy
+            disp[b, 0] -= sx
+            disp[b, 1] -= sy
+        for i in range(n):
+            pos[i, 0] = max(lower_x, min(upper_x, pos[i, 0] + disp[i, 0]))
+            pos[i, 1] = max(lower_y, min(upper_y, pos[i, 1] + disp[i, 1]))
+
+        # Stop once no node moves more than the tolerance in an iteration
+        moved = 0.0
+        for i in range(n):
+            moved = max(moved, abs(pos[i, 0] - previous[i, 0]), abs(pos[i, 1] - previous[i, 1]))
+        if moved < tolerance:
+            break
+    return pos
+
+@njit(cache=True, fastmath=True)
+def ease_step(pos, target, rows, speed, eps, out_mask):
+    """Ease the given rows of pos towards target in one fused pass, in place"""
+    for k in range(rows.shape[0]):
+        i = rows[k]
+        dx = target[i, 0] - pos[i, 0]
+        dy = target[i, 1] - pos[i, 1]
+        # Rows already within eps of their target snap onto it
+        moving = abs(dx) >= eps or abs(dy) >= eps
+        step = speed if moving else 1.0
+        pos[i, 0] += dx * step
+        pos[i, 1] += dy * step
+        out_mask[k] = moving
+    return out_mask